@@ -90,12 +90,13 @@ class ImageHandler:
         """
         class_attr = f' className="{classes}"' if classes else ""
 
-        # Build extra ARIA attribute string
+        # Build extra ARIA attribute string — joined once instead of
+        # repeated string += per attribute
         extra_attrs = ""
         if aria_attrs:
-            for key in sorted(aria_attrs.keys()):
-                val = aria_attrs[key]
-                extra_attrs += f' {key}="{val}"'
+            extra_attrs = "".join(
+                f' {key}="{aria_attrs[key]}"' for key in sorted(aria_attrs)
+            )
 
         if node.is_svg_candidate:
             return self._generate_svg_placeholder(node, class_attr + extra_attrs)
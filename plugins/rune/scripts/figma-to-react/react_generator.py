@@ -13,13 +13,16 @@ Usage::
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import re
-from typing import Dict, List, Optional
+import sys
+from typing import Any, Dict, List, Optional, Tuple
 
 from figma_types import NodeType, TypeStyle
 from image_handler import ImageHandler, _sanitize_alt_text, collect_image_refs
 from layout_resolver import resolve_child_layout, resolve_container_layout
-from node_parser import FigmaIRNode
+from node_parser import FigmaIRNode, StyledTextSegment
 from style_builder import StyleBuilder
 from tailwind_mapper import (
     TailwindMapper,
@@ -38,11 +41,32 @@ from tailwind_mapper import (
 _COMPONENT_NAME_RE = re.compile(r"[^a-zA-Z0-9]")
 
 
+def _capitalize_word(word: str) -> str:
+    """Capitalize a name part, skipping words already in that form.
+
+    ``str.capitalize`` always rebuilds the string and lowercases the
+    tail; Figma names are usually Pascal-ish already, so checking first
+    avoids the allocation on the common path. Behavior is identical —
+    mixed-case tails still get lowercased.
+
+    Args:
+        word: Non-empty name part.
+
+    Returns:
+        Word with upper first character and lowercase tail.
+    """
+    if word[0].isupper() and (len(word) == 1 or word[1:].islower()):
+        return word
+    return word.capitalize()
+
+
+@functools.lru_cache(maxsize=1024)
 def _to_component_name(name: str) -> str:
     """Convert a Figma node name to a valid React component name.
 
     Sanitizes the name to PascalCase and ensures it starts with an
-    uppercase letter.
+    uppercase letter. Pure function of the name, so results are
+    memoized — Figma trees repeat auto-generated names heavily.
 
     Args:
         name: Raw Figma node name.
@@ -52,7 +76,7 @@ def _to_component_name(name: str) -> str:
     """
     # Split on non-alphanumeric chars, capitalize each part
     parts = _COMPONENT_NAME_RE.split(name)
-    pascal = "".join(p.capitalize() for p in parts if p)
+    pascal = "".join(_capitalize_word(p) for p in parts if p)
     if not pascal:
         return "Component"
     if pascal[0].isdigit():
@@ -152,6 +176,31 @@ def _is_decorative_name(name: str) -> bool:
     return bool(_DECORATIVE_NAME_RE.match(name.strip()))
 
 
+# Sentinel marking template slots filled from the node name at emit time.
+_ARIA_LABEL_FROM_NAME = object()
+
+# Fixed per-tag attribute templates, built once — emit time is a single
+# dict.get plus a short loop instead of an if/elif chain per node.
+# Values are interned so every emitted element shares one str object per
+# attribute value across the whole tree.
+_ARIA_TAG_DEFAULTS = {
+    tag: tuple(
+        (sys.intern(key), val if val is _ARIA_LABEL_FROM_NAME else sys.intern(val))
+        for key, val in template
+    )
+    for tag, template in {
+        "button": (("type", "button"),),
+        "input": (("type", "text"), ("aria-label", _ARIA_LABEL_FROM_NAME)),
+        "nav": (("aria-label", _ARIA_LABEL_FROM_NAME),),
+        "header": (("role", "banner"),),
+        "footer": (("role", "contentinfo"),),
+        "h1": (("role", "heading"), ("aria-level", "1")),
+        "h2": (("role", "heading"), ("aria-level", "2")),
+        "h3": (("role", "heading"), ("aria-level", "3")),
+    }.items()
+}
+
+
 def _resolve_aria_attrs(node: FigmaIRNode, tag: str) -> Dict[str, str]:
     """Resolve ARIA accessibility attributes for a node.
 
@@ -170,34 +219,21 @@ def _resolve_aria_attrs(node: FigmaIRNode, tag: str) -> Dict[str, str]:
         return {}
 
     attrs: Dict[str, str] = {}
-    name_lower = node.name.lower()
-
-    if tag == "button":
-        attrs["type"] = "button"
-
-    elif tag == "input":
-        attrs["type"] = "text"
-        label = _sanitize_alt_text(node.name)
-        if label:
-            attrs["aria-label"] = label
-
-    elif tag == "nav":
-        label = _sanitize_alt_text(node.name)
-        if label:
-            attrs["aria-label"] = label
-
-    elif tag == "header":
-        attrs["role"] = "banner"
-
-    elif tag == "footer":
-        attrs["role"] = "contentinfo"
-
-    elif tag in ("h1", "h2", "h3"):
-        attrs["role"] = "heading"
-        attrs["aria-level"] = tag[1]
 
-    elif tag == "div":
+    template = _ARIA_TAG_DEFAULTS.get(tag)
+    if template is not None:
+        for key, val in template:
+            if val is _ARIA_LABEL_FROM_NAME:
+                label = _sanitize_alt_text(node.name)
+                if label:
+                    attrs[key] = label
+            else:
+                attrs[key] = val
+        return attrs
+
+    if tag == "div":
         # Interactive-looking nodes that resolved to div
+        name_lower = node.name.lower()
         if any(kw in name_lower for kw in ("button", "btn", "cta")):
             attrs["role"] = "button"
             attrs["tabIndex"] = "{0}"
@@ -235,12 +271,19 @@ def _resolve_aria_attrs_image(node: FigmaIRNode) -> Dict[str, str]:
     return attrs
 
 
+# Canonical attribute emit order — alphabetical over every attribute the
+# resolvers produce, so emission stays deterministic without re-sorting
+# per node. Unknown attributes (none today) are appended sorted.
+_ATTR_EMIT_ORDER = ("aria-hidden", "aria-label", "aria-level", "role", "tabIndex", "type")
+_ATTR_EMIT_ORDER_SET = frozenset(_ATTR_EMIT_ORDER)
+
+
 def _format_html_attrs(class_str: str, aria_attrs: Dict[str, str]) -> str:
     """Format className and ARIA attributes into a JSX attribute string.
 
     Produces a leading-space-prefixed string suitable for insertion into
     an opening HTML tag. ``className`` comes first, followed by other
-    attributes sorted alphabetically for deterministic output.
+    attributes in ``_ATTR_EMIT_ORDER`` for deterministic output.
 
     Args:
         class_str: Tailwind class string (may be empty).
@@ -249,22 +292,33 @@ def _format_html_attrs(class_str: str, aria_attrs: Dict[str, str]) -> str:
     Returns:
         Formatted attribute string with leading space, or empty string.
     """
+    # Flat fragment buffer joined once at the end — one allocation for
+    # the whole attribute string instead of one per attribute.
     parts: List[str] = []
 
     if class_str:
-        parts.append(f'className="{class_str}"')
+        parts.append(' className="')
+        parts.append(class_str)
+        parts.append('"')
+
+    keys: List[str] = [k for k in _ATTR_EMIT_ORDER if k in aria_attrs]
+    if len(keys) != len(aria_attrs):
+        keys.extend(sorted(k for k in aria_attrs if k not in _ATTR_EMIT_ORDER_SET))
 
-    for key in sorted(aria_attrs.keys()):
+    for key in keys:
         val = aria_attrs[key]
+        parts.append(" ")
+        parts.append(key)
         if val.startswith("{") and val.endswith("}"):
             # JSX expression syntax (e.g., tabIndex={0})
-            parts.append(f"{key}={val}")
+            parts.append("=")
+            parts.append(val)
         else:
-            parts.append(f'{key}="{val}"')
+            parts.append('="')
+            parts.append(val)
+            parts.append('"')
 
-    if not parts:
-        return ""
-    return " " + " ".join(parts)
+    return "".join(parts)
 
 
 # ---------------------------------------------------------------------------
@@ -300,7 +354,42 @@ def _deduplicate_classes(classes: List[str]) -> List[str]:
     return result
 
 
+# Class-synthesis caches. The signature → Tailwind-class mapping is
+# deterministic, and real designs repeat the same handful of style
+# signatures across hundreds of nodes, so hit rates are very high.
+# Pydantic models are unhashable, so keys are built from field
+# primitives (via _key_value) rather than using functools.lru_cache
+# directly. Cleared wholesale at the bound — the signature space of a
+# single design is far smaller.
+_NODE_STYLE_CACHE: Dict[tuple, Tuple[str, ...]] = {}
+_TEXT_CLASS_CACHE: Dict[tuple, Tuple[str, ...]] = {}
+_STYLE_CACHE_MAX = 2048
+
+
 def _resolve_node_styles(node: FigmaIRNode) -> List[str]:
+    """Build Tailwind classes for a node's visual styles, memoized.
+
+    Keyed on the node's shallow structural key — every field that feeds
+    the StyleBuilder pipeline is part of the key, so two nodes with the
+    same signature share one computation.
+
+    Args:
+        node: IR node to style.
+
+    Returns:
+        List of Tailwind utility classes.
+    """
+    key = _structural_key(node, include_children=False)
+    cached = _NODE_STYLE_CACHE.get(key)
+    if cached is None:
+        if len(_NODE_STYLE_CACHE) >= _STYLE_CACHE_MAX:
+            _NODE_STYLE_CACHE.clear()
+        cached = tuple(_build_node_styles(node))
+        _NODE_STYLE_CACHE[key] = cached
+    return list(cached)
+
+
+def _build_node_styles(node: FigmaIRNode) -> List[str]:
     """Build Tailwind classes for a node's visual styles.
 
     Uses StyleBuilder to extract CSS properties from fills, strokes,
@@ -346,7 +435,10 @@ def _resolve_node_styles(node: FigmaIRNode) -> List[str]:
 
 
 def _resolve_text_styles(style: Optional[TypeStyle]) -> List[str]:
-    """Build Tailwind classes for text typography.
+    """Build Tailwind classes for text typography, memoized.
+
+    Keyed on the typography primitives the mapping reads — TypeStyle
+    itself is a Pydantic model and unhashable.
 
     Args:
         style: TypeStyle from the text node.
@@ -357,6 +449,35 @@ def _resolve_text_styles(style: Optional[TypeStyle]) -> List[str]:
     if style is None:
         return []
 
+    key = (
+        style.font_size,
+        style.font_weight,
+        style.letter_spacing,
+        style.line_height_px,
+        style.text_align_horizontal,
+        style.font_family,
+        style.italic,
+        style.text_decoration,
+        _key_value(style.fills),
+    )
+    cached = _TEXT_CLASS_CACHE.get(key)
+    if cached is None:
+        if len(_TEXT_CLASS_CACHE) >= _STYLE_CACHE_MAX:
+            _TEXT_CLASS_CACHE.clear()
+        cached = tuple(_build_text_styles(style))
+        _TEXT_CLASS_CACHE[key] = cached
+    return list(cached)
+
+
+def _build_text_styles(style: TypeStyle) -> List[str]:
+    """Build Tailwind classes for text typography.
+
+    Args:
+        style: TypeStyle from the text node.
+
+    Returns:
+        List of Tailwind typography classes.
+    """
     classes: List[str] = []
 
     if style.font_size is not None:
@@ -469,39 +590,195 @@ def _generate_text_jsx(
 
     # Rich text with styled segments
     lines: List[str] = [f"<{tag}{attr_str}>"]
-    for segment in node.text_segments:
-        seg_classes = _resolve_text_styles(segment.style)
+    _emit_styled_text(lines, node.text_segments)
+    lines.append(f"</{tag}>")
+    return "\n".join(lines)
+
+
+def _emit_styled_text(lines: List[str], segments: List[StyledTextSegment]) -> None:
+    """Append ``<span>`` lines for styled text segments in one pass.
+
+    Rich text alternates between a handful of styles (bold/normal runs
+    share TypeStyle objects), so the resolved class string is cached per
+    style object for the duration of the node — each distinct style pays
+    the typography mapping once regardless of segment count.
+
+    Args:
+        lines: Line buffer to append span fragments to.
+        segments: Styled text segments from the text node.
+    """
+    class_cache: Dict[int, str] = {}
+    for segment in segments:
+        style = segment.style
+        key = id(style)
+        seg_class_str = class_cache.get(key)
+        if seg_class_str is None:
+            seg_class_str = " ".join(_resolve_text_styles(style))
+            class_cache[key] = seg_class_str
         text = _escape_jsx(segment.text)
-        if seg_classes:
-            seg_class_str = " ".join(seg_classes)
+        if seg_class_str:
             lines.append(f'  <span className="{seg_class_str}">{text}</span>')
         else:
             lines.append(f"  {text}")
-    lines.append(f"</{tag}>")
-    return "\n".join(lines)
 
 
-def _generate_node_jsx(
+# Fields excluded from the structural key. Identity fields (``node_id``,
+# ``unique_name``) differ between visually identical subtrees, and ``raw``
+# is the original API dict kept only for fallback access — none of them
+# influence the emitted JSX.
+_KEY_SKIP_FIELDS = frozenset({"node_id", "unique_name", "raw", "children"})
+
+_IR_KEY_FIELDS: Tuple[str, ...] = tuple(
+    f.name for f in dataclasses.fields(FigmaIRNode) if f.name not in _KEY_SKIP_FIELDS
+)
+
+
+def _key_value(val: Any) -> Any:
+    """Convert a field value into a hashable cache-key component.
+
+    Lists and dicts are tuple-ized recursively; Pydantic models (Paint,
+    Effect, TypeStyle) and other unhashable values fall back to their
+    deterministic ``repr``.
+
+    Args:
+        val: Raw field value from an IR node.
+
+    Returns:
+        Hashable representation of the value.
+    """
+    if isinstance(val, list):
+        return tuple(_key_value(v) for v in val)
+    if isinstance(val, dict):
+        return tuple(sorted((k, _key_value(v)) for k, v in val.items()))
+    try:
+        hash(val)
+    except TypeError:
+        return repr(val)
+    return val
+
+
+def _structural_key(node: FigmaIRNode, include_children: bool = True) -> tuple:
+    """Build a structural hash key for an IR node subtree.
+
+    Two nodes with the same key render to identical JSX, regardless of
+    their Figma node IDs — design files repeat icons, buttons, and form
+    fields with identical structure dozens of times.
+
+    Args:
+        node: IR node to key.
+        include_children: When True, recurse into children so the key
+            covers the whole subtree. Shallow keys are used for parents,
+            whose children do not affect a child's own rendering.
+
+    Returns:
+        Hashable tuple uniquely identifying the (sub)tree structure.
+    """
+    key = tuple(_key_value(getattr(node, name)) for name in _IR_KEY_FIELDS)
+    if include_children:
+        return (key, tuple(_structural_key(c) for c in node.children))
+    return key
+
+
+def _append_block(out: List[str], block: str, prefix: str) -> None:
+    """Append a pre-rendered JSX block to the line buffer.
+
+    Only the first line receives the prefix — continuation lines of a
+    multi-line block (rich text spans, image JSX) keep their own
+    indentation, matching how parent elements indent child blocks.
+
+    Args:
+        out: Line buffer to append to.
+        block: Rendered JSX block (may span multiple lines).
+        prefix: Indentation prefix for the block's first line.
+    """
+    if "\n" in block:
+        first, rest = block.split("\n", 1)
+        out.append(prefix + first)
+        out.extend(rest.split("\n"))
+    else:
+        out.append(prefix + block)
+
+
+def _emit_node_jsx(
     node: FigmaIRNode,
     parent: Optional[FigmaIRNode],
     image_handler: ImageHandler,
-    indent_level: int = 0,
-    aria: bool = False,
-) -> str:
-    """Recursively generate JSX for an IR node and its children.
+    out: List[str],
+    prefix: str,
+    indent_level: int,
+    aria: bool,
+    memo: Dict[tuple, Tuple[str, ...]],
+) -> None:
+    """Append JSX lines for an IR node, memoizing repeated subtrees.
+
+    Rendering is keyed on the node's structural hash (plus a shallow key
+    of its parent, which drives child layout classes). Identical subtrees
+    — repeated icons, buttons, list items — render once and replay from
+    cache. Cached lines carry no first-line prefix, so one entry serves
+    every indentation context.
+
+    The memo dict lives for a single ``_generate_node_jsx`` call, so the
+    image URL mapping and ``aria`` flag are constant for all entries.
 
     Args:
         node: Current IR node.
         parent: Parent IR node (for child layout resolution).
         image_handler: Image handler for resolving image fills.
+        out: Line buffer to append to.
+        prefix: Indentation prefix for this node's opening line.
         indent_level: Current indentation level.
         aria: When True, emit ARIA accessibility attributes.
-
-    Returns:
-        JSX string for the node subtree.
+        memo: Per-render cache of structural key → rendered lines.
     """
+    # Child iteration filters invisible nodes before recursing; this
+    # guard only covers an invisible root passed in directly.
     if not node.visible:
-        return ""
+        return
+
+    key = (
+        _structural_key(node),
+        _structural_key(parent, include_children=False) if parent is not None else None,
+    )
+    cached = memo.get(key)
+    if cached is None:
+        buf: List[str] = []
+        _render_node_jsx(node, parent, image_handler, buf, indent_level, aria, memo)
+        cached = tuple(buf)
+        memo[key] = cached
+
+    if cached:
+        out.append(prefix + cached[0])
+        out.extend(cached[1:])
+
+
+def _render_node_jsx(
+    node: FigmaIRNode,
+    parent: Optional[FigmaIRNode],
+    image_handler: ImageHandler,
+    out: List[str],
+    indent_level: int,
+    aria: bool,
+    memo: Dict[tuple, Tuple[str, ...]],
+) -> None:
+    """Recursively append JSX lines for an IR node and its children.
+
+    Appending lines to a shared buffer (joined once at the top) keeps
+    generation linear in output size — embedding child strings into a
+    parent f-string at every level re-copies each subtree once per
+    ancestor, which is quadratic for deep trees. The node's own opening
+    line is emitted unprefixed; ``_emit_node_jsx`` applies the caller's
+    prefix when splicing cached lines into the output.
+
+    Args:
+        node: Current IR node.
+        parent: Parent IR node (for child layout resolution).
+        image_handler: Image handler for resolving image fills.
+        out: Line buffer to append to.
+        indent_level: Current indentation level.
+        aria: When True, emit ARIA accessibility attributes.
+        memo: Per-render cache, threaded through to child emission.
+    """
+    prefix = ""
 
     # Collect all classes
     all_classes: List[str] = []
@@ -529,7 +806,12 @@ def _generate_node_jsx(
     # Image/SVG handling
     if image_handler.has_image(node):
         aria_attrs = _resolve_aria_attrs_image(node) if aria else None
-        return image_handler.generate_image_jsx(node, class_str, aria_attrs=aria_attrs)
+        _append_block(
+            out,
+            image_handler.generate_image_jsx(node, class_str, aria_attrs=aria_attrs),
+            prefix,
+        )
+        return
 
     # Resolve semantic HTML tag
     tag = _resolve_html_tag(node)
@@ -539,53 +821,108 @@ def _generate_node_jsx(
         text_classes = _resolve_text_styles(node.text_style)
         full_classes = " ".join(_deduplicate_classes(all_classes + text_classes))
         text_aria = _resolve_aria_attrs(node, tag) if aria else None
-        return _generate_text_jsx(node, full_classes, indent_level, tag=tag, aria_attrs=text_aria)
+        _append_block(
+            out,
+            _generate_text_jsx(node, full_classes, indent_level, tag=tag, aria_attrs=text_aria),
+            prefix,
+        )
+        return
 
-    # Container/element node — build attribute string
-    node_aria: Dict[str, str] = {}
+    # Container/element node — build attribute string. The whole ARIA
+    # resolution step lives behind this guard, so aria=False pays nothing
+    # beyond the branch itself (not even an empty-dict allocation).
+    node_aria: Optional[Dict[str, str]] = None
     if aria:
         node_aria = _resolve_aria_attrs(node, tag)
         attr_str = _format_html_attrs(class_str, node_aria)
     else:
         attr_str = f' className="{class_str}"' if class_str else ""
 
-    if not node.children:
-        if tag in _VOID_ELEMENTS:
-            return f"<{tag}{attr_str} />"
-        return f"<{tag}{attr_str} />"
-
-    # Generate children
-    child_jsxs: List[str] = []
+    # Generate children into a scratch buffer — we only know whether the
+    # element self-closes after seeing if any child emitted output.
+    # Invisible children are dropped here, before any recursion — their
+    # subtrees can be arbitrarily large and contribute nothing to output.
+    child_lines: List[str] = []
     for child in node.children:
-        child_jsx = _generate_node_jsx(child, node, image_handler, indent_level + 1, aria=aria)
-        if child_jsx:
-            child_jsxs.append(child_jsx)
+        if not child.visible:
+            continue
+        _emit_node_jsx(child, node, image_handler, child_lines, "  ", indent_level + 1, aria, memo)
 
-    if not child_jsxs:
-        if tag in _VOID_ELEMENTS:
-            return f"<{tag}{attr_str} />"
-        return f"<{tag}{attr_str} />"
+    if not child_lines:
+        out.append(f"{prefix}<{tag}{attr_str} />")
+        return
 
     # Void elements (input, img, etc.) cannot have children in React.
     # Wrap in a <div> — ARIA attrs go on the void element, className on the div.
     if tag in _VOID_ELEMENTS:
-        children_str = "\n".join(f"  {jsx}" for jsx in child_jsxs)
-        # Split attrs: className on wrapper div, ARIA/type on the void element
+        # Split attrs structurally: className on the wrapper div, ARIA/type
+        # on the void element — no per-attr partition scan needed.
         div_attr = f' className="{class_str}"' if class_str else ""
-        if node_aria:
-            void_attr = _format_html_attrs("", node_aria)
-        else:
-            void_attr = ""
-        return f"<div{div_attr}>\n  <{tag}{void_attr} />\n{children_str}\n</div>"
+        void_attr = _format_html_attrs("", node_aria) if node_aria else ""
+        out.append(f"{prefix}<div{div_attr}>")
+        out.append(f"  <{tag}{void_attr} />")
+        out.extend(child_lines)
+        out.append("</div>")
+        return
 
-    children_str = "\n".join(f"  {jsx}" for jsx in child_jsxs)
-    return f"<{tag}{attr_str}>\n{children_str}\n</{tag}>"
+    out.append(f"{prefix}<{tag}{attr_str}>")
+    out.extend(child_lines)
+    out.append(f"</{tag}>")
+
+
+def _generate_node_jsx(
+    node: FigmaIRNode,
+    parent: Optional[FigmaIRNode],
+    image_handler: ImageHandler,
+    indent_level: int = 0,
+    aria: bool = False,
+) -> str:
+    """Generate JSX for an IR node subtree.
+
+    Thin wrapper over ``_emit_node_jsx`` that owns the line buffer and
+    the per-render subtree memo, joining the buffer once.
+
+    Args:
+        node: Current IR node.
+        parent: Parent IR node (for child layout resolution).
+        image_handler: Image handler for resolving image fills.
+        indent_level: Current indentation level.
+        aria: When True, emit ARIA accessibility attributes.
+
+    Returns:
+        JSX string for the node subtree.
+    """
+    out: List[str] = []
+    memo: Dict[tuple, Tuple[str, ...]] = {}
+    _emit_node_jsx(node, parent, image_handler, out, "", indent_level, aria, memo)
+    return "\n".join(out)
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
+# Component boilerplate as single format-string templates — one
+# allocation for the fixed wrapper instead of piecewise line appends.
+# The closing brace and trailing newline are guaranteed by construction.
+_COMPONENT_TEMPLATE = (
+    "import React from 'react';\n"
+    "\n"
+    "{interface}"
+    "export default function {name}({signature}) {{\n"
+    "  return (\n"
+    "{body}\n"
+    "  );\n"
+    "}}\n"
+)
+
+_PROPS_INTERFACE_TEMPLATE = (
+    "interface {name}Props {{\n"
+    "{fields}\n"
+    "}}\n"
+    "\n"
+)
+
 
 def generate_component(
     root: FigmaIRNode,
@@ -620,26 +957,18 @@ def generate_component(
     # Generate JSX body
     jsx = _generate_node_jsx(root, None, image_handler, indent_level=1, aria=aria)
 
-    # Build component
-    lines: List[str] = []
-    lines.append("import React from 'react';")
-    lines.append("")
-    lines.append(f"export default function {name}() {{")
-    lines.append("  return (")
-    lines.append(_indent(jsx, 2))
-    lines.append("  );")
-    lines.append("}")
-    lines.append("")
+    code = _COMPONENT_TEMPLATE.format(
+        interface="", name=name, signature="", body=_indent(jsx, 2)
+    )
 
     # Add TODO comments for unresolved images
     unresolved = [ref for ref in refs if ref not in (image_urls or {})]
     if unresolved:
-        lines.append("// TODO: Resolve image references via Figma Images API:")
-        for ref in unresolved:
-            lines.append(f"//   - {ref}")
-        lines.append("")
+        todo_lines = ["// TODO: Resolve image references via Figma Images API:"]
+        todo_lines.extend(f"//   - {ref}" for ref in unresolved)
+        code += "\n" + "\n".join(todo_lines) + "\n"
 
-    return "\n".join(lines)
+    return code
 
 
 def generate_component_with_props(
@@ -670,30 +999,19 @@ def generate_component_with_props(
 
     jsx = _generate_node_jsx(root, None, image_handler, indent_level=1, aria=aria)
 
-    lines: List[str] = []
-    lines.append("import React from 'react';")
-    lines.append("")
-
     if props:
-        lines.append(f"interface {name}Props {{")
-        for prop in props:
-            lines.append(f"  {prop}?: string;")
-        lines.append("}")
-        lines.append("")
-        prop_destructure = ", ".join(props)
-        lines.append(
-            f"export default function {name}({{ {prop_destructure} }}: {name}Props) {{"
+        interface = _PROPS_INTERFACE_TEMPLATE.format(
+            name=name,
+            fields="\n".join(f"  {prop}?: string;" for prop in props),
         )
+        signature = f"{{ {', '.join(props)} }}: {name}Props"
     else:
-        lines.append(f"export default function {name}() {{")
+        interface = ""
+        signature = ""
 
-    lines.append("  return (")
-    lines.append(_indent(jsx, 2))
-    lines.append("  );")
-    lines.append("}")
-    lines.append("")
-
-    return "\n".join(lines)
+    return _COMPONENT_TEMPLATE.format(
+        interface=interface, name=name, signature=signature, body=_indent(jsx, 2)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -701,6 +1019,14 @@ def generate_component_with_props(
 # ---------------------------------------------------------------------------
 
 
+# Translation table built once at module load — str.translate replaces
+# all four JSX-special characters in a single C-level pass with one
+# result allocation.
+_JSX_ESCAPE_TABLE = str.maketrans(
+    {"{": "&#123;", "}": "&#125;", "<": "&lt;", ">": "&gt;"}
+)
+
+
 def _escape_jsx(text: str) -> str:
     """Escape text for safe inclusion in JSX.
 
@@ -713,10 +1039,7 @@ def _escape_jsx(text: str) -> str:
     Returns:
         JSX-safe text string.
     """
-    text = text.replace("{", "&#123;")
-    text = text.replace("}", "&#125;")
-    text = text.replace("<", "&lt;")
-    text = text.replace(">", "&gt;")
+    text = text.translate(_JSX_ESCAPE_TABLE)
     # Convert newlines to JSX <br /> elements
     if "\n" in text:
         parts = text.split("\n")
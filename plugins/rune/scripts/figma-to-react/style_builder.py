@@ -24,7 +24,9 @@ Usage::
 
 from __future__ import annotations
 
+import functools
 import math
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
 from figma_types import (
@@ -131,22 +133,103 @@ def _gradient_stops_css(stops: Optional[List[Any]]) -> Optional[str]:
     return ", ".join(parts)
 
 
+# Pure value → CSS helpers, memoized. Design systems reuse a handful of
+# spacing/radius/opacity tokens across thousands of nodes, so repeated
+# inputs resolve via a dict lookup instead of float formatting.
+# typed=True keeps int and float keys separate — 8 and 8.0 compare equal
+# but format as "8px" vs "8.0px". That discrimination only covers
+# top-level arguments, so the values are passed as individual scalars
+# rather than one tuple ((8, 8, 8, 8) and (8.0, 8.0, 8.0, 8.0) would
+# otherwise share a cache slot).
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _padding_to_css(
+    top: float, right: float, bottom: float, left: float
+) -> Tuple[Tuple[str, str], ...]:
+    """Map padding sides to CSS property/value pairs.
+
+    Args:
+        top: Padding top in pixels.
+        right: Padding right in pixels.
+        bottom: Padding bottom in pixels.
+        left: Padding left in pixels.
+
+    Returns:
+        Tuple of (property, value) pairs; empty when all sides are zero.
+    """
+    if top == right == bottom == left:
+        if top == 0:
+            return ()
+        return (("padding", f"{top}px"),)
+    if top == bottom and left == right:
+        return (("padding-x", f"{left}px"), ("padding-y", f"{top}px"))
+    pairs: List[Tuple[str, str]] = []
+    if top > 0:
+        pairs.append(("padding-top", f"{top}px"))
+    if right > 0:
+        pairs.append(("padding-right", f"{right}px"))
+    if bottom > 0:
+        pairs.append(("padding-bottom", f"{bottom}px"))
+    if left > 0:
+        pairs.append(("padding-left", f"{left}px"))
+    return tuple(pairs)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _opacity_to_css(value: float) -> Optional[str]:
+    """Format an opacity value, or None when fully opaque.
+
+    Args:
+        value: Opacity value (0.0-1.0).
+
+    Returns:
+        Two-decimal CSS opacity string, or None for >= 1.0.
+    """
+    if value < 1.0:
+        return f"{value:.2f}"
+    return None
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _radius_to_css(uniform: float, *per_corner: float) -> Optional[str]:
+    """Format corner radii as a border-radius value.
+
+    Per-corner radii arrive as varargs so typed=True sees each element
+    as a top-level argument and keeps int/float keys distinct.
+
+    Args:
+        uniform: Uniform corner radius (used if no per-corner radii).
+        *per_corner: Per-corner radii, if any.
+
+    Returns:
+        CSS border-radius string, or None when all radii are zero.
+    """
+    if per_corner and any(r > 0 for r in per_corner):
+        return " ".join(f"{r}px" for r in per_corner)
+    if uniform > 0:
+        return f"{uniform}px"
+    return None
+
+
 # ---------------------------------------------------------------------------
 # StyleBuilder
 # ---------------------------------------------------------------------------
 
 
+@dataclass(slots=True)
 class StyleBuilder:
     """Chainable builder for extracting CSS properties from Figma data.
 
     Accumulates raw CSS property values into an internal dict. Call
     ``.build()`` to retrieve the final properties dict.
 
-    Each method returns ``self`` to enable fluent chaining.
+    Each method returns ``self`` to enable fluent chaining. Declared
+    with ``slots=True`` so the chained hot path does attribute access
+    through a fixed slot instead of a per-instance ``__dict__``.
     """
 
-    def __init__(self) -> None:
-        self._props: Dict[str, str] = {}
+    _props: Dict[str, str] = field(default_factory=dict)
 
     def fills(self, paints: List[Paint], *, is_text: bool = False) -> StyleBuilder:
         """Extract background/fill properties from Figma paints.
@@ -279,11 +362,9 @@ class StyleBuilder:
         Returns:
             Self for chaining.
         """
-        if per_corner and any(r > 0 for r in per_corner):
-            radii = [f"{r}px" for r in per_corner]
-            self._props["border-radius"] = " ".join(radii)
-        elif uniform > 0:
-            self._props["border-radius"] = f"{uniform}px"
+        radius = _radius_to_css(uniform, *(per_corner or ()))
+        if radius is not None:
+            self._props["border-radius"] = radius
 
         return self
 
@@ -296,8 +377,9 @@ class StyleBuilder:
         Returns:
             Self for chaining.
         """
-        if value < 1.0:
-            self._props["opacity"] = f"{value:.2f}"
+        css = _opacity_to_css(value)
+        if css is not None:
+            self._props["opacity"] = css
         return self
 
     def size(
@@ -347,25 +429,7 @@ class StyleBuilder:
         Returns:
             Self for chaining.
         """
-        top, right, bottom, left = values
-        if all(v == 0 for v in values):
-            return self
-
-        if top == right == bottom == left:
-            self._props["padding"] = f"{top}px"
-        elif top == bottom and left == right:
-            self._props["padding-x"] = f"{left}px"
-            self._props["padding-y"] = f"{top}px"
-        else:
-            if top > 0:
-                self._props["padding-top"] = f"{top}px"
-            if right > 0:
-                self._props["padding-right"] = f"{right}px"
-            if bottom > 0:
-                self._props["padding-bottom"] = f"{bottom}px"
-            if left > 0:
-                self._props["padding-left"] = f"{left}px"
-
+        self._props.update(_padding_to_css(*values))
         return self
 
     def gap(self, value: float) -> StyleBuilder:
@@ -484,6 +548,18 @@ class StyleBuilder:
         """
         return dict(self._props)
 
+    def reset(self) -> StyleBuilder:
+        """Clear accumulated properties so the builder can be reused.
+
+        Clearing in place avoids re-allocating a builder per node when
+        callers process many nodes in a loop.
+
+        Returns:
+            Self for chaining.
+        """
+        self._props.clear()
+        return self
+
     # -- Private helpers --
 
     @staticmethod
@@ -20,9 +20,10 @@ Usage::
 
 from __future__ import annotations
 
-import math
+import bisect
+import functools
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -170,6 +171,33 @@ _TW_COLORS: Dict[str, Dict[int, Tuple[int, int, int]]] = {
 _COLOR_SNAP_THRESHOLD: float = 20.0
 
 
+# ---------------------------------------------------------------------------
+# Compiled patterns
+# ---------------------------------------------------------------------------
+
+# Hoisted to module level so repeated calls during a batch conversion use
+# the compiled pattern directly instead of going through re's per-call
+# pattern-cache lookup.
+_RGBA_RE = re.compile(r"rgba?\((\d+),\s*(\d+),\s*(\d+)")
+_GRADIENT_INNER_RE = re.compile(r"gradient\((.+)\)")
+_GRADIENT_STOP_RE = re.compile(r"(#[0-9a-fA-F]{3,8}|rgba?\([^)]+\))\s*(\d+%)?")
+_SHADOW_OFFSETS_RE = re.compile(
+    r"(-?\d+(?:\.\d+)?)px\s+(-?\d+(?:\.\d+)?)px\s+(\d+(?:\.\d+)?)px"
+)
+_SHADOW_COLOR_RE = re.compile(r"(rgba?\([^)]+\)|#[0-9a-fA-F]{3,8})")
+_BLACK_RGBA_RE = re.compile(r"rgba\(\s*0,\s*0,\s*0,")
+_ROTATE_RE = re.compile(r"rotate\((-?\d+(?:\.\d+)?)deg\)")
+_BLUR_RE = re.compile(r"blur\((\d+(?:\.\d+)?)px\)")
+
+# CSS gradient direction -> Tailwind v4 direction suffix
+# (bg-linear-to-{suffix}). Bound once instead of per _map_gradient call.
+_GRADIENT_DIRECTION_MAP: Dict[str, str] = {
+    "to bottom": "b", "to top": "t", "to right": "r", "to left": "l",
+    "to bottom right": "br", "to top right": "tr",
+    "to bottom left": "bl", "to top left": "tl",
+}
+
+
 # ---------------------------------------------------------------------------
 # Tailwind v4 scale mappings
 # ---------------------------------------------------------------------------
@@ -189,6 +217,12 @@ _FONT_WEIGHT_SCALE: Dict[int, str] = {
     700: "font-bold", 800: "font-extrabold", 900: "font-black",
 }
 
+# Font weight classes indexed by round(weight / 100); slot 0 is unused.
+# Derived from _FONT_WEIGHT_SCALE so the two stay in sync.
+_FONT_WEIGHT_CLASSES: Tuple[Optional[str], ...] = (None,) + tuple(
+    _FONT_WEIGHT_SCALE[w] for w in sorted(_FONT_WEIGHT_SCALE)
+)
+
 # Border radius scale: class name -> px value (Tailwind v4)
 _BORDER_RADIUS_SCALE: Dict[str, float] = {
     "rounded-none": 0, "rounded-xs": 2, "rounded-sm": 4, "rounded": 6,
@@ -202,6 +236,42 @@ _SHADOW_BLUR_SCALE: Dict[str, float] = {
     "shadow-lg": 10, "shadow-xl": 20, "shadow-2xl": 25,
 }
 
+# The radius and font-size scales are ascending, so nearest-pivot
+# snapping can bisect the sorted pivot tuple instead of scanning every
+# entry. Pivot/class tuples are bound once at import.
+_FONT_SIZE_CLASSES: Tuple[str, ...] = tuple(_FONT_SIZE_SCALE.keys())
+_FONT_SIZE_PIVOTS: Tuple[float, ...] = tuple(_FONT_SIZE_SCALE.values())
+_BORDER_RADIUS_CLASSES: Tuple[str, ...] = tuple(_BORDER_RADIUS_SCALE.keys())
+_BORDER_RADIUS_PIVOTS: Tuple[float, ...] = tuple(_BORDER_RADIUS_SCALE.values())
+_SHADOW_BLUR_ITEMS: Tuple[Tuple[str, float], ...] = tuple(_SHADOW_BLUR_SCALE.items())
+
+
+def _snap_to_scale(
+    px: float,
+    pivots: Tuple[float, ...],
+    classes: Tuple[str, ...],
+) -> Tuple[str, float]:
+    """Find the nearest scale entry for a value via binary search.
+
+    Args:
+        px: Value to snap.
+        pivots: Ascending scale pivot values.
+        classes: Class names parallel to ``pivots``.
+
+    Returns:
+        Tuple of (class name, pivot value) for the nearest pivot.
+    """
+    i = bisect.bisect_left(pivots, px)
+    if i == 0:
+        return classes[0], pivots[0]
+    if i == len(pivots):
+        return classes[-1], pivots[-1]
+    before = pivots[i - 1]
+    after = pivots[i]
+    if px - before <= after - px:
+        return classes[i - 1], before
+    return classes[i], after
+
 # Opacity scale: class name -> value
 _OPACITY_SCALE: Dict[str, float] = {
     "opacity-0": 0.0, "opacity-5": 0.05, "opacity-10": 0.10,
@@ -219,21 +289,23 @@ _OPACITY_SCALE: Dict[str, float] = {
 # ---------------------------------------------------------------------------
 
 
-def _rgb_distance(c1: Tuple[int, int, int], c2: Tuple[int, int, int]) -> float:
-    """Euclidean distance between two RGB tuples.
+# Palette flattened to one (r, g, b, "name-shade") row per shade at
+# import time. snap_color makes a single linear pass over this structure
+# with squared distances — no nested dict walk and no sqrt per entry.
+_PALETTE_FLAT: Tuple[Tuple[int, int, int, str], ...] = tuple(
+    (rgb[0], rgb[1], rgb[2], f"{name}-{shade}")
+    for name, shades in _TW_COLORS.items()
+    for shade, rgb in shades.items()
+)
 
-    Args:
-        c1: First RGB tuple (0-255).
-        c2: Second RGB tuple (0-255).
+_COLOR_SNAP_THRESHOLD_SQ: float = _COLOR_SNAP_THRESHOLD ** 2
 
-    Returns:
-        Euclidean distance.
-    """
-    return math.sqrt(
-        (c1[0] - c2[0]) ** 2
-        + (c1[1] - c2[1]) ** 2
-        + (c1[2] - c2[2]) ** 2
-    )
+# ASCII -> hex nibble lookup table. Entries for non-hex-digit characters
+# hold 255 so a single range check rejects invalid input.
+_HEX_NIBBLE = bytearray(255 for _ in range(256))
+for _i, _c in enumerate("0123456789abcdef"):
+    _HEX_NIBBLE[ord(_c)] = _i
+    _HEX_NIBBLE[ord(_c.upper())] = _i
 
 
 def _parse_hex(hex_str: str) -> Optional[Tuple[int, int, int]]:
@@ -248,13 +320,14 @@ def _parse_hex(hex_str: str) -> Optional[Tuple[int, int, int]]:
     hex_str = hex_str.lstrip("#")
     if len(hex_str) < 6:
         return None
+    table = _HEX_NIBBLE
     try:
-        r = int(hex_str[0:2], 16)
-        g = int(hex_str[2:4], 16)
-        b = int(hex_str[4:6], 16)
-        return (r, g, b)
-    except ValueError:
+        n0, n1, n2, n3, n4, n5 = (table[ord(c)] for c in hex_str[:6])
+    except IndexError:  # non-ASCII character
+        return None
+    if (n0 | n1 | n2 | n3 | n4 | n5) > 15:
         return None
+    return (n0 << 4 | n1, n2 << 4 | n3, n4 << 4 | n5)
 
 
 def _parse_rgba(rgba_str: str) -> Optional[Tuple[int, int, int]]:
@@ -266,12 +339,13 @@ def _parse_rgba(rgba_str: str) -> Optional[Tuple[int, int, int]]:
     Returns:
         RGB tuple (0-255), or None if parsing fails.
     """
-    match = re.match(r"rgba?\((\d+),\s*(\d+),\s*(\d+)", rgba_str)
+    match = _RGBA_RE.match(rgba_str)
     if match:
         return (int(match.group(1)), int(match.group(2)), int(match.group(3)))
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def snap_color(css_color: str, prefix: str = "bg") -> str:
     """Map a CSS color to the nearest Tailwind palette class.
 
@@ -304,20 +378,21 @@ def snap_color(css_color: str, prefix: str = "bg") -> str:
             return named
         return f"{prefix}-[{css_color}]"
 
-    best_dist = float("inf")
-    best_name = ""
-    best_shade = 500
+    r, g, b = rgb
+    best_d2 = float("inf")
+    best_suffix = ""
 
-    for palette_name, shades in _TW_COLORS.items():
-        for shade, palette_rgb in shades.items():
-            dist = _rgb_distance(rgb, palette_rgb)
-            if dist < best_dist:
-                best_dist = dist
-                best_name = palette_name
-                best_shade = shade
+    for pr, pg, pb, suffix in _PALETTE_FLAT:
+        dr = pr - r
+        dg = pg - g
+        db = pb - b
+        d2 = dr * dr + dg * dg + db * db
+        if d2 < best_d2:
+            best_d2 = d2
+            best_suffix = suffix
 
-    if best_dist <= _COLOR_SNAP_THRESHOLD:
-        return f"{prefix}-{best_name}-{best_shade}"
+    if best_d2 <= _COLOR_SNAP_THRESHOLD_SQ:
+        return f"{prefix}-{best_suffix}"
 
     # Use hex arbitrary value
     hex_color = f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
@@ -385,121 +460,59 @@ class TailwindMapper:
 
         return classes
 
-    def _map_single(self, prop: str, value: str) -> List[str]:
-        """Map a single CSS property to Tailwind classes.
+    def map_properties_batch(
+        self,
+        props_list: List[Dict[str, str]],
+    ) -> List[List[str]]:
+        """Convert many CSS property dicts to Tailwind classes in one pass.
+
+        A conversion pass produces one props dict per Figma node, and
+        sibling nodes frequently share identical styling. Identical
+        dicts are mapped once and the class list is reused, so the
+        per-property dispatch runs per unique style rather than per
+        node.
 
         Args:
-            prop: CSS property name.
-            value: CSS property value.
+            props_list: Props dicts, one per node.
 
         Returns:
-            List of Tailwind classes for this property.
+            List of Tailwind class lists, parallel to ``props_list``.
         """
-        if prop == "background-color":
-            return [snap_color(value, "bg")]
-
-        if prop == "color":
-            return [snap_color(value, "text")]
-
-        if prop == "background-image":
-            return self._map_gradient(value)
-
-        if prop == "border-color":
-            return [snap_color(value, "border")]
-
-        if prop == "border-width":
-            return [self._map_border_width(value)]
-
-        if prop == "border-style":
-            return [f"border-{value}"]
-
-        if prop == "border-radius":
-            return self._map_border_radius(value)
-
-        if prop == "box-shadow":
-            return [self._map_shadow(value)]
-
-        if prop == "opacity":
-            return [self._map_opacity(value)]
-
-        if prop == "width":
-            return [self._map_dimension(value, "w")]
-
-        if prop == "height":
-            return [self._map_dimension(value, "h")]
-
-        if prop == "min-width":
-            return [self._map_dimension(value, "min-w")]
-
-        if prop == "max-width":
-            return [self._map_dimension(value, "max-w")]
-
-        if prop == "min-height":
-            return [self._map_dimension(value, "min-h")]
-
-        if prop == "max-height":
-            return [self._map_dimension(value, "max-h")]
-
-        if prop == "padding":
-            px = _parse_px(value)
-            return [f"p-{_px_to_spacing(px)}"] if px is not None else []
-
-        if prop == "padding-x":
-            px = _parse_px(value)
-            return [f"px-{_px_to_spacing(px)}"] if px is not None else []
-
-        if prop == "padding-y":
-            px = _parse_px(value)
-            return [f"py-{_px_to_spacing(px)}"] if px is not None else []
-
-        if prop == "padding-top":
-            px = _parse_px(value)
-            return [f"pt-{_px_to_spacing(px)}"] if px is not None else []
-
-        if prop == "padding-right":
-            px = _parse_px(value)
-            return [f"pr-{_px_to_spacing(px)}"] if px is not None else []
-
-        if prop == "padding-bottom":
-            px = _parse_px(value)
-            return [f"pb-{_px_to_spacing(px)}"] if px is not None else []
-
-        if prop == "padding-left":
-            px = _parse_px(value)
-            return [f"pl-{_px_to_spacing(px)}"] if px is not None else []
+        memo: Dict[Tuple[Tuple[str, str], ...], List[str]] = {}
+        results: List[List[str]] = []
 
-        if prop == "gap":
-            px = _parse_px(value)
-            return [f"gap-{_px_to_spacing(px)}"] if px is not None else []
+        for props in props_list:
+            key = tuple(props.items())
+            cached = memo.get(key)
+            if cached is None:
+                cached = self.map_properties(props)
+                memo[key] = cached
+            results.append(list(cached))
 
-        if prop == "filter" and "blur" in value:
-            return [self._map_blur(value, "blur")]
+        return results
 
-        if prop == "backdrop-filter" and "blur" in value:
-            return [self._map_blur(value, "backdrop-blur")]
-
-        if prop == "mix-blend-mode":
-            return [f"mix-blend-{value}"]
-
-        if prop == "transform" and "rotate" in value:
-            return [self._map_rotation(value)]
-
-        if prop == "overflow":
-            return [f"overflow-{value}"]
+    def _map_single(self, prop: str, value: str) -> List[str]:
+        """Map a single CSS property to Tailwind classes.
 
-        if prop == "background-size":
-            return [f"bg-{value}"]
+        Dispatches through ``_PROP_HANDLERS`` — one dict lookup per
+        property instead of a membership-test chain over every handled
+        property name.
 
-        if prop == "background-position":
-            return [f"bg-{value}"]
+        Args:
+            prop: CSS property name.
+            value: CSS property value.
 
-        # Internal markers (e.g., _image_ref) are skipped
-        if prop.startswith("_"):
+        Returns:
+            List of Tailwind classes for this property.
+        """
+        handler = _PROP_HANDLERS.get(prop)
+        if handler is None:
+            # Unknown properties and internal markers (e.g., _image_ref)
             return []
+        return handler(value)
 
-        return []
-
-    def _map_gradient(self, value: str) -> List[str]:
+    @staticmethod
+    def _map_gradient(value: str) -> List[str]:
         """Map a CSS gradient to Tailwind v4 gradient classes.
 
         Extracts direction and color stops from CSS gradient syntax,
@@ -511,31 +524,25 @@ class TailwindMapper:
         Returns:
             List of Tailwind gradient classes.
         """
-        # Tailwind v4: bg-linear-to-{direction}
-        direction_map = {
-            "to bottom": "b", "to top": "t", "to right": "r", "to left": "l",
-            "to bottom right": "br", "to top right": "tr",
-            "to bottom left": "bl", "to top left": "tl",
-        }
-
         classes: List[str] = []
 
         if "linear-gradient" in value:
+            # Tailwind v4: bg-linear-to-{direction}
             tw_dir = "b"  # default
-            for css_dir, d in direction_map.items():
+            for css_dir, d in _GRADIENT_DIRECTION_MAP.items():
                 if css_dir in value:
                     tw_dir = d
                     break
             classes.append(f"bg-linear-to-{tw_dir}")
 
             # Extract color stops
-            stop_classes = self._extract_gradient_stops(value)
+            stop_classes = TailwindMapper._extract_gradient_stops(value)
             classes.extend(stop_classes)
             return classes
 
         if "radial-gradient" in value:
             classes.append("bg-radial")
-            stop_classes = self._extract_gradient_stops(value)
+            stop_classes = TailwindMapper._extract_gradient_stops(value)
             classes.extend(stop_classes)
             return classes
 
@@ -552,7 +559,7 @@ class TailwindMapper:
             List of Tailwind from-/via-/to- classes.
         """
         # Extract the content inside the gradient function parentheses
-        paren_match = re.search(r"gradient\((.+)\)", value)
+        paren_match = _GRADIENT_INNER_RE.search(value)
         if not paren_match:
             return []
 
@@ -560,10 +567,7 @@ class TailwindMapper:
 
         # Split on color stops — each is "color position%"
         # Match: hex colors, rgba(), or named colors followed by optional percentage
-        stop_pattern = re.findall(
-            r"(#[0-9a-fA-F]{3,8}|rgba?\([^)]+\))\s*(\d+%)?",
-            inner,
-        )
+        stop_pattern = _GRADIENT_STOP_RE.findall(inner)
         if not stop_pattern:
             return []
 
@@ -603,7 +607,8 @@ class TailwindMapper:
             return "border-8"
         return f"border-[{px:.0f}px]"
 
-    def _map_border_radius(self, value: str) -> List[str]:
+    @staticmethod
+    def _map_border_radius(value: str) -> List[str]:
         """Map border-radius to Tailwind classes.
 
         Args:
@@ -614,7 +619,7 @@ class TailwindMapper:
         """
         parts = value.split()
         if len(parts) == 1:
-            return [self._snap_radius(parts[0])]
+            return [TailwindMapper._snap_radius(parts[0])]
 
         # Per-corner: TL TR BR BL
         if len(parts) == 4:
@@ -623,15 +628,16 @@ class TailwindMapper:
             for corner, px_str in zip(corners, parts):
                 px = _parse_px(px_str)
                 if px is not None and px > 0:
-                    snapped = self._snap_radius(px_str)
+                    snapped = TailwindMapper._snap_radius(px_str)
                     # Replace 'rounded' prefix with corner-specific
                     suffix = snapped.replace("rounded", "")
                     classes.append(f"rounded-{corner}{suffix}")
             return classes
 
-        return [self._snap_radius(parts[0])]
+        return [TailwindMapper._snap_radius(parts[0])]
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _snap_radius(value: str) -> str:
         """Snap a border-radius value to the nearest Tailwind scale.
 
@@ -645,21 +651,17 @@ class TailwindMapper:
         if px is None or px <= 0:
             return "rounded-none"
 
-        best_class = "rounded"
-        best_diff = float("inf")
-
-        for tw_class, scale_px in _BORDER_RADIUS_SCALE.items():
-            diff = abs(px - scale_px)
-            if diff < best_diff:
-                best_diff = diff
-                best_class = tw_class
+        best_class, scale_px = _snap_to_scale(
+            px, _BORDER_RADIUS_PIVOTS, _BORDER_RADIUS_CLASSES
+        )
 
         # If the closest match is more than 2px off, use arbitrary
-        if best_diff > 2:
+        if abs(px - scale_px) > 2:
             return f"rounded-[{px:.0f}px]"
         return best_class
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _map_shadow(value: str) -> str:
         """Map a box-shadow to a Tailwind shadow class.
 
@@ -673,27 +675,27 @@ class TailwindMapper:
         Returns:
             Tailwind shadow class.
         """
+        # Substring check, not startswith: StyleBuilder joins drop shadows
+        # before inner shadows, so the inset segment may appear anywhere
+        # in a combined value.
         if "inset" in value:
             return "shadow-inner"
 
         # Parse shadow components: x y blur [spread] color
         # Match: offset_x offset_y blur_radius
-        blur_match = re.search(
-            r"(-?\d+(?:\.\d+)?)px\s+(-?\d+(?:\.\d+)?)px\s+(\d+(?:\.\d+)?)px",
-            value,
-        )
+        blur_match = _SHADOW_OFFSETS_RE.search(value)
         if not blur_match:
             return "shadow"
 
         blur_radius = float(blur_match.group(3))
 
         # Check for non-standard color (not black/gray)
-        color_match = re.search(r"(rgba?\([^)]+\)|#[0-9a-fA-F]{3,8})", value)
+        color_match = _SHADOW_COLOR_RE.search(value)
         has_custom_color = False
         if color_match:
             color_str = color_match.group(1)
             # Standard Tailwind shadows use black with varying opacity
-            if not re.match(r"rgba\(\s*0,\s*0,\s*0,", color_str):
+            if not _BLACK_RGBA_RE.match(color_str):
                 has_custom_color = True
 
         # If non-standard color, use arbitrary value to preserve it
@@ -703,18 +705,13 @@ class TailwindMapper:
             return f"shadow-[{clean}]"
 
         # Standard shadow — snap to named class
-        best_class = "shadow"
-        best_diff = float("inf")
-
-        for tw_class, scale_blur in _SHADOW_BLUR_SCALE.items():
-            diff = abs(blur_radius - scale_blur)
-            if diff < best_diff:
-                best_diff = diff
-                best_class = tw_class
-
+        best_class, _ = min(
+            _SHADOW_BLUR_ITEMS, key=lambda item: abs(blur_radius - item[1])
+        )
         return best_class
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _map_opacity(value: str) -> str:
         """Map an opacity value to the nearest Tailwind opacity class.
 
@@ -762,6 +759,7 @@ class TailwindMapper:
         return f"{prefix}-[{value}]"
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _map_rotation(value: str) -> str:
         """Map a CSS rotate transform to a Tailwind rotate class.
 
@@ -774,7 +772,7 @@ class TailwindMapper:
         Returns:
             Tailwind rotate class (e.g., "rotate-45", "-rotate-90", "rotate-[12deg]").
         """
-        match = re.search(r"rotate\((-?\d+(?:\.\d+)?)deg\)", value)
+        match = _ROTATE_RE.match(value)
         if not match:
             return "rotate-0"
 
@@ -810,7 +808,7 @@ class TailwindMapper:
         Returns:
             Tailwind blur class.
         """
-        match = re.search(r"blur\((\d+(?:\.\d+)?)px\)", value)
+        match = _BLUR_RE.match(value)
         if not match:
             return prefix
 
@@ -834,11 +832,75 @@ class TailwindMapper:
         return prefix
 
 
+# ---------------------------------------------------------------------------
+# Property dispatch table
+# ---------------------------------------------------------------------------
+
+
+def _map_spacing(value: str, prefix: str) -> List[str]:
+    """Map a px spacing value to a prefixed Tailwind spacing class.
+
+    Args:
+        value: CSS px value string.
+        prefix: Tailwind spacing prefix ("p", "px", "gap", ...).
+
+    Returns:
+        Single-class list, or empty when the value does not parse.
+    """
+    px = _parse_px(value)
+    return [f"{prefix}-{_px_to_spacing(px)}"] if px is not None else []
+
+
+# CSS property -> handler(value) -> class list. Built once at import so
+# map_properties does one dict lookup per input property instead of a
+# membership-test chain over every handled property name.
+_PROP_HANDLERS: Dict[str, Callable[[str], List[str]]] = {
+    "background-color": lambda v: [snap_color(v, "bg")],
+    "color": lambda v: [snap_color(v, "text")],
+    "background-image": TailwindMapper._map_gradient,
+    "border-color": lambda v: [snap_color(v, "border")],
+    "border-width": lambda v: [TailwindMapper._map_border_width(v)],
+    "border-style": lambda v: [f"border-{v}"],
+    "border-radius": TailwindMapper._map_border_radius,
+    "box-shadow": lambda v: [TailwindMapper._map_shadow(v)],
+    "opacity": lambda v: [TailwindMapper._map_opacity(v)],
+    "filter": lambda v: [TailwindMapper._map_blur(v, "blur")] if "blur" in v else [],
+    "backdrop-filter": (
+        lambda v: [TailwindMapper._map_blur(v, "backdrop-blur")] if "blur" in v else []
+    ),
+    "mix-blend-mode": lambda v: [f"mix-blend-{v}"],
+    "transform": (
+        lambda v: [TailwindMapper._map_rotation(v)] if "rotate" in v else []
+    ),
+    "overflow": lambda v: [f"overflow-{v}"],
+    "background-size": lambda v: [f"bg-{v}"],
+    "background-position": lambda v: [f"bg-{v}"],
+}
+
+for _dim_prop, _dim_prefix in (
+    ("width", "w"), ("height", "h"),
+    ("min-width", "min-w"), ("max-width", "max-w"),
+    ("min-height", "min-h"), ("max-height", "max-h"),
+):
+    _PROP_HANDLERS[_dim_prop] = (
+        lambda v, _p=_dim_prefix: [TailwindMapper._map_dimension(v, _p)]
+    )
+
+for _sp_prop, _sp_prefix in (
+    ("padding", "p"), ("padding-x", "px"), ("padding-y", "py"),
+    ("padding-top", "pt"), ("padding-right", "pr"),
+    ("padding-bottom", "pb"), ("padding-left", "pl"),
+    ("gap", "gap"),
+):
+    _PROP_HANDLERS[_sp_prop] = lambda v, _p=_sp_prefix: _map_spacing(v, _p)
+
+
 # ---------------------------------------------------------------------------
 # Typography helpers
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=4096)
 def map_font_size(px: float) -> str:
     """Map a font size in pixels to the nearest Tailwind text class.
 
@@ -848,21 +910,15 @@ def map_font_size(px: float) -> str:
     Returns:
         Tailwind text size class (e.g., "text-base" or "text-[17px]").
     """
-    best_class = "text-base"
-    best_diff = float("inf")
-
-    for tw_class, scale_px in _FONT_SIZE_SCALE.items():
-        diff = abs(px - scale_px)
-        if diff < best_diff:
-            best_diff = diff
-            best_class = tw_class
+    best_class, scale_px = _snap_to_scale(px, _FONT_SIZE_PIVOTS, _FONT_SIZE_CLASSES)
 
     # If closest match is more than 1px off, use arbitrary
-    if best_diff > 1:
+    if abs(px - scale_px) > 1:
         return f"text-[{px:.0f}px]"
     return best_class
 
 
+@functools.lru_cache(maxsize=4096)
 def map_font_weight(weight: float) -> str:
     """Map a numeric font weight to Tailwind class.
 
@@ -872,11 +928,10 @@ def map_font_weight(weight: float) -> str:
     Returns:
         Tailwind font weight class (e.g., "font-bold").
     """
-    rounded = round(weight / 100) * 100
-    rounded = max(100, min(900, rounded))
-    return _FONT_WEIGHT_SCALE.get(rounded, f"font-[{int(weight)}]")
+    return _FONT_WEIGHT_CLASSES[max(1, min(9, round(weight / 100)))]
 
 
+@functools.lru_cache(maxsize=4096)
 def map_letter_spacing(px: float) -> str:
     """Map letter spacing in pixels to Tailwind tracking class.
 
@@ -900,6 +955,7 @@ def map_letter_spacing(px: float) -> str:
     return "tracking-widest"
 
 
+@functools.lru_cache(maxsize=4096)
 def map_line_height(px: float, font_size: float) -> str:
     """Map line height to Tailwind leading class.
 
@@ -65,9 +65,22 @@ for _mod_name in [
                 spec.loader.exec_module(mod)
 
 
+from tailwind_mapper import TailwindMapper  # noqa: E402
+
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(scope="session")
+def mapper() -> TailwindMapper:
+    """Shared TailwindMapper instance.
+
+    The mapper is stateless (all palette/scale tables are module-level
+    constants), so one instance can serve the whole session instead of
+    constructing a fresh mapper per test.
+    """
+    return TailwindMapper()
+
+
 @pytest.fixture()
 def sample_figma_response() -> dict:
     """Load the sample Figma API response fixture."""
@@ -4,15 +4,13 @@ from __future__ import annotations
 import json
 import sys
 from io import StringIO
-from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 # Add parent directory to path so we can import the module under test
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from cli import _extract_component_name, _mask_token, _supports_color, build_parser, main  # noqa: E402
+from cli import _extract_component_name, _mask_token, _supports_color, build_parser, main
 
 
 # ---------------------------------------------------------------------------
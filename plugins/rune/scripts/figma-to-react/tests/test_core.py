@@ -1,16 +1,13 @@
 """Tests for core.py — business logic extracted from server.py."""
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 
 import pytest
 
 # Add parent directory to path so we can import the module under test
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from core import extract_react_code, ir_to_dict, paginate_output  # noqa: E402
-from node_parser import parse_node  # noqa: E402
+from core import extract_react_code, ir_to_dict, paginate_output
+from node_parser import parse_node
 
 
 # ---------------------------------------------------------------------------
@@ -1,17 +1,13 @@
 """Tests for figma_client.py — Figma REST API client, cache, and error handling."""
 from __future__ import annotations
 
-import sys
 import time
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-from figma_client import (  # noqa: E402
+from figma_client import (
     FigmaAPIError,
     FigmaAuthError,
     FigmaBadRequestError,
@@ -1,13 +1,9 @@
 """Tests for image_handler.py — image fill detection and JSX generation."""
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 from image_handler import ImageHandler, collect_image_refs, _sanitize_alt_text
 from node_parser import FigmaIRNode
 from figma_types import NodeType
@@ -21,16 +21,12 @@ To recapture the fixture (requires FIGMA_TOKEN):
 from __future__ import annotations
 
 import json
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-from core import extract_react_code, fetch_design, to_react  # noqa: E402
-from node_parser import parse_node, walk_tree  # noqa: E402
-from tests.mock_figma_client import MockFigmaClient, FIXTURES_DIR  # noqa: E402
+from core import extract_react_code, fetch_design, to_react
+from node_parser import parse_node, walk_tree
+from tests.mock_figma_client import MockFigmaClient, FIXTURES_DIR
 
 # ---------------------------------------------------------------------------
 # Fixtures
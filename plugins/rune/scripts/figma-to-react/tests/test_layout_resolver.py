@@ -1,13 +1,9 @@
 """Tests for layout_resolver.py — auto-layout to Tailwind flex/grid classes."""
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 from layout_resolver import (
     LayoutClasses,
     resolve_container_layout,
@@ -1,14 +1,10 @@
 """Tests for node_parser.py — Figma JSON to intermediate FigmaNode IR."""
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-from node_parser import (  # noqa: E402
+from node_parser import (
     FigmaIRNode,
     StyledTextSegment,
     count_nodes,
@@ -1,13 +1,13 @@
 """Tests for react_generator.py — React JSX code generation from Figma IR."""
 from __future__ import annotations
 
-import sys
-from pathlib import Path
+import dataclasses
+import functools
+import re
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
+# sys.path bootstrap lives in conftest.py — no per-file insert needed.
 from react_generator import (
     generate_component,
     generate_component_with_props,
@@ -23,6 +23,37 @@ from node_parser import FigmaIRNode, StyledTextSegment
 from figma_types import Color, LayoutMode, LayoutSizingMode, NodeType, Paint, PaintType, TypeStyle
 
 
+# ---------------------------------------------------------------------------
+# Shared Paint/TypeStyle fixtures — pure value objects, validated once at
+# import instead of per-test to avoid repeated Pydantic validation.
+# ---------------------------------------------------------------------------
+
+_DARK_TEXT_FILL = Paint.model_validate({
+    "type": "SOLID",
+    "visible": True,
+    "color": {"r": 0.23, "g": 0.23, "b": 0.23, "a": 1.0},
+})
+_WHITE_FILL = Paint.model_validate({
+    "type": "SOLID",
+    "visible": True,
+    "color": {"r": 1.0, "g": 1.0, "b": 1.0, "a": 1.0},
+})
+_POPPINS_STYLE = TypeStyle.model_validate({
+    "fontSize": 16.0,
+    "fontWeight": 400.0,
+    "fontFamily": "Poppins",
+})
+_INTER_STYLE = TypeStyle.model_validate({
+    "fontSize": 16.0,
+    "fontWeight": 400.0,
+    "fontFamily": "Inter",
+})
+_NO_FAMILY_STYLE = TypeStyle.model_validate({
+    "fontSize": 16.0,
+    "fontWeight": 400.0,
+})
+
+
 # ---------------------------------------------------------------------------
 # Helper to build minimal IR nodes
 # ---------------------------------------------------------------------------
@@ -53,6 +84,35 @@ def _make_text_node(**overrides) -> FigmaIRNode:
     return FigmaIRNode(**defaults)
 
 
+def _assert_all_in(s: str, *needles: str) -> None:
+    """Assert every needle appears in ``s``, reporting all misses at once.
+
+    Collapses back-to-back ``assert "X" in code`` chains into a single
+    pass over the haystack and gives a better failure message (the full
+    list of missing substrings instead of just the first).
+    """
+    missing = [n for n in needles if n not in s]
+    assert not missing, f"missing substrings: {missing}"
+
+
+# Compiled once for the structural assertions below — in-method
+# re.search(pattern_str, ...) recompiles (or at least re-probes the
+# pattern cache) on every call.
+_W36_RE = re.compile(r"w-36")
+_DIV_WITH_TYPE_RE = re.compile(r'<div[^>]*type="text"')
+_INPUT_WITH_TYPE_RE = re.compile(r'<input[^>]*type="text"')
+_DIV_WITH_ARIA_LABEL_RE = re.compile(r"<div[^>]*aria-label")
+_INPUT_WITH_EMAIL_LABEL_RE = re.compile(r'<input[^>]*aria-label="Email Input"')
+_DIV_WITH_CLASSNAME_RE = re.compile(r'<div\s+className="[^"]*"')
+_BUTTON_WITH_TYPE_RE = re.compile(r'<button[^>]*type="button"')
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_escape(s: str) -> str:
+    """Memoized ``_escape_jsx`` for tests that assert on the same inputs."""
+    return _escape_jsx(s)
+
+
 # ---------------------------------------------------------------------------
 # _to_component_name
 # ---------------------------------------------------------------------------
@@ -91,15 +151,15 @@ class TestEscapeJsx:
     """Test JSX text escaping."""
 
     def test_plain_text_unchanged(self):
-        assert _escape_jsx("Hello World") == "Hello World"
+        assert _cached_escape("Hello World") == "Hello World"
 
     def test_curly_braces_escaped(self):
-        result = _escape_jsx("{value}")
+        result = _cached_escape("{value}")
         assert "&#123;" in result
         assert "&#125;" in result
 
     def test_angle_brackets_escaped(self):
-        result = _escape_jsx("<script>alert(1)</script>")
+        result = _cached_escape("<script>alert(1)</script>")
         assert "&lt;" in result
         assert "&gt;" in result
 
@@ -108,18 +168,20 @@ class TestEscapeJsx:
 # generate_component — basic structure
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="class")
+def default_code() -> str:
+    """Default-node output, rendered once per test class."""
+    return generate_component(_make_node())
+
+
 class TestGenerateComponentStructure:
     """Test generated component structure and boilerplate."""
 
-    def test_has_import(self):
-        root = _make_node()
-        code = generate_component(root)
-        assert "import React from 'react'" in code
+    def test_has_import(self, default_code):
+        assert "import React from 'react'" in default_code
 
-    def test_has_export_default(self):
-        root = _make_node()
-        code = generate_component(root)
-        assert "export default function" in code
+    def test_has_export_default(self, default_code):
+        assert "export default function" in default_code
 
     def test_uses_node_name(self):
         root = _make_node(name="HeroSection")
@@ -132,16 +194,13 @@ class TestGenerateComponentStructure:
         assert "MyCard" in code
         assert "Someframe" not in code
 
-    def test_has_return_statement(self):
-        root = _make_node()
-        code = generate_component(root)
-        assert "return (" in code
+    def test_has_return_statement(self, default_code):
+        assert "return (" in default_code
 
-    def test_ends_with_closing_brace(self):
-        root = _make_node()
-        code = generate_component(root)
-        lines = code.strip().split("\n")
-        assert any(line.strip() == "}" for line in lines)
+    def test_ends_with_closing_brace(self, default_code):
+        # The template emit guarantees the closing brace terminates the
+        # component, so a tail check replaces the old full-output scan.
+        assert default_code.rstrip().endswith("}")
 
 
 # ---------------------------------------------------------------------------
@@ -186,9 +245,9 @@ class TestTextNodeGeneration:
 
     def test_rich_text_with_segments(self):
         """Text with multiple styled segments should use span wrappers."""
-        # TypeStyle uses Pydantic aliases — must use model_validate with alias keys
-        style_bold = TypeStyle.model_validate({"fontSize": 16.0, "fontWeight": 700.0})
-        style_normal = TypeStyle.model_validate({"fontSize": 16.0, "fontWeight": 400.0})
+        # Known-good values — model_construct skips alias resolution/validation
+        style_bold = TypeStyle.model_construct(font_size=16.0, font_weight=700.0)
+        style_normal = TypeStyle.model_construct(font_size=16.0, font_weight=400.0)
         segments = [
             StyledTextSegment(text="Bold ", style=style_bold),
             StyledTextSegment(text="and normal", style=style_normal),
@@ -199,8 +258,7 @@ class TestTextNodeGeneration:
         )
         root = _make_node(children=[text])
         code = generate_component(root)
-        assert "<span" in code
-        assert "Bold " in code
+        _assert_all_in(code, "<span", "Bold ")
 
 
 # ---------------------------------------------------------------------------
@@ -222,8 +280,7 @@ class TestImageNodeGeneration:
         )
         root = _make_node(children=[img])
         code = generate_component(root, image_urls={"hash123": "https://cdn.example.com/img.png"})
-        assert "<img" in code
-        assert "https://cdn.example.com/img.png" in code
+        _assert_all_in(code, "<img", "https://cdn.example.com/img.png")
 
     def test_unresolved_image_adds_todo(self):
         img = _make_node(
@@ -234,8 +291,7 @@ class TestImageNodeGeneration:
         )
         root = _make_node(children=[img])
         code = generate_component(root)
-        assert "TODO" in code
-        assert "unresolved_hash" in code
+        _assert_all_in(code, "TODO", "unresolved_hash")
 
     def test_svg_candidate_generates_svg(self):
         icon = _make_node(
@@ -247,8 +303,7 @@ class TestImageNodeGeneration:
         )
         root = _make_node(children=[icon])
         code = generate_component(root)
-        assert "<svg" in code
-        assert "CloseIcon" in code
+        _assert_all_in(code, "<svg", "CloseIcon")
 
 
 # ---------------------------------------------------------------------------
@@ -274,9 +329,7 @@ class TestNestedGeneration:
             children=[child],
         )
         code = generate_component(root)
-        assert "flex" in code
-        assert "flex-row" in code
-        assert "gap-2" in code
+        _assert_all_in(code, "flex", "flex-row", "gap-2")
 
 
 # ---------------------------------------------------------------------------
@@ -293,9 +346,7 @@ class TestGenerateComponentWithProps:
             component_name="Card",
             prop_names=["title", "subtitle"],
         )
-        assert "interface CardProps" in code
-        assert "title?: string" in code
-        assert "subtitle?: string" in code
+        _assert_all_in(code, "interface CardProps", "title?: string", "subtitle?: string")
 
     def test_destructures_props(self):
         root = _make_node()
@@ -360,22 +411,22 @@ class TestResolveHtmlTag:
         assert _resolve_html_tag(node) == "footer"
 
     def test_large_text_is_h1(self):
-        style = TypeStyle.model_validate({"fontSize": 36.0, "fontWeight": 700.0})
+        style = TypeStyle.model_construct(font_size=36.0, font_weight=700.0)
         node = _make_text_node(name="Heading", text_style=style)
         assert _resolve_html_tag(node) == "h1"
 
     def test_medium_text_is_h2(self):
-        style = TypeStyle.model_validate({"fontSize": 24.0, "fontWeight": 600.0})
+        style = TypeStyle.model_construct(font_size=24.0, font_weight=600.0)
         node = _make_text_node(name="Subheading", text_style=style)
         assert _resolve_html_tag(node) == "h2"
 
     def test_h3_text(self):
-        style = TypeStyle.model_validate({"fontSize": 20.0, "fontWeight": 500.0})
+        style = TypeStyle.model_construct(font_size=20.0, font_weight=500.0)
         node = _make_text_node(name="Label", text_style=style)
         assert _resolve_html_tag(node) == "h3"
 
     def test_small_text_is_p(self):
-        style = TypeStyle.model_validate({"fontSize": 14.0, "fontWeight": 400.0})
+        style = TypeStyle.model_construct(font_size=14.0, font_weight=400.0)
         node = _make_text_node(name="Body", text_style=style)
         assert _resolve_html_tag(node) == "p"
 
@@ -403,7 +454,7 @@ class TestSemanticHtmlGeneration:
         assert "<button" in code
 
     def test_heading_text_generates_h_tag(self):
-        style = TypeStyle.model_validate({"fontSize": 32.0, "fontWeight": 700.0})
+        style = TypeStyle.model_construct(font_size=32.0, font_weight=700.0)
         text = _make_text_node(
             name="PageTitle",
             text_content="Welcome",
@@ -411,8 +462,7 @@ class TestSemanticHtmlGeneration:
         )
         root = _make_node(children=[text])
         code = generate_component(root)
-        assert "<h1" in code
-        assert "Welcome" in code
+        _assert_all_in(code, "<h1", "Welcome")
 
     def test_nav_container_generates_nav_tag(self):
         child = _make_node(node_id="3:1", name="Link", children=[])
@@ -456,8 +506,7 @@ class TestSvgPathRendering:
         )
         root = _make_node(children=[icon])
         code = generate_component(root)
-        assert "<svg" in code
-        assert '<path d="M10 20L20 10L30 20"' in code
+        _assert_all_in(code, "<svg", '<path d="M10 20L20 10L30 20"')
         assert "TODO" not in code
 
     def test_evenodd_winding_rule(self):
@@ -542,15 +591,10 @@ class TestTextColorFills:
 
     def test_text_node_solid_fill_uses_text_color(self):
         """TEXT nodes with solid fills should produce text-* classes."""
-        blue_fill = Paint.model_validate({
-            "type": "SOLID",
-            "visible": True,
-            "color": {"r": 0.23, "g": 0.23, "b": 0.23, "a": 1.0},
-        })
         text = _make_text_node(
             name="Title",
             text_content="Hello",
-            fills=[blue_fill],
+            fills=[_DARK_TEXT_FILL],
         )
         root = _make_node(children=[text])
         code = generate_component(root)
@@ -567,12 +611,7 @@ class TestTextColorFills:
 
     def test_frame_node_fill_still_uses_bg(self):
         """Non-TEXT nodes should still use bg-* for fills."""
-        fill = Paint.model_validate({
-            "type": "SOLID",
-            "visible": True,
-            "color": {"r": 1.0, "g": 1.0, "b": 1.0, "a": 1.0},
-        })
-        node = _make_node(fills=[fill])
+        node = _make_node(fills=[_WHITE_FILL])
         code = generate_component(node)
         assert "bg-" in code
 
@@ -587,15 +626,10 @@ class TestFontFamilySupport:
 
     def test_custom_font_family(self):
         """Custom fonts should produce font-['FontName'] classes."""
-        style = TypeStyle.model_validate({
-            "fontSize": 16.0,
-            "fontWeight": 400.0,
-            "fontFamily": "Poppins",
-        })
         text = _make_text_node(
             name="Body",
             text_content="Hello",
-            text_style=style,
+            text_style=_POPPINS_STYLE,
         )
         root = _make_node(children=[text])
         code = generate_component(root)
@@ -603,15 +637,10 @@ class TestFontFamilySupport:
 
     def test_system_font_maps_to_named(self):
         """Common system fonts map to Tailwind named classes."""
-        style = TypeStyle.model_validate({
-            "fontSize": 16.0,
-            "fontWeight": 400.0,
-            "fontFamily": "Inter",
-        })
         text = _make_text_node(
             name="Body",
             text_content="Hello",
-            text_style=style,
+            text_style=_INTER_STYLE,
         )
         root = _make_node(children=[text])
         code = generate_component(root)
@@ -620,14 +649,10 @@ class TestFontFamilySupport:
 
     def test_no_font_family(self):
         """No fontFamily should not add any font class."""
-        style = TypeStyle.model_validate({
-            "fontSize": 16.0,
-            "fontWeight": 400.0,
-        })
         text = _make_text_node(
             name="Body",
             text_content="Hello",
-            text_style=style,
+            text_style=_NO_FAMILY_STYLE,
         )
         root = _make_node(children=[text])
         code = generate_component(root)
@@ -644,14 +669,12 @@ class TestNewlineHandling:
 
     def test_newline_converts_to_br(self):
         """Newlines in text should become <br /> elements."""
-        result = _escape_jsx("Line one\nLine two")
-        assert "<br />" in result
-        assert "Line one" in result
-        assert "Line two" in result
+        result = _cached_escape("Line one\nLine two")
+        _assert_all_in(result, "<br />", "Line one", "Line two")
 
     def test_no_newline_unchanged(self):
         """Text without newlines should pass through unchanged."""
-        result = _escape_jsx("No newlines here")
+        result = _cached_escape("No newlines here")
         assert "<br />" not in result
 
 
@@ -748,8 +771,7 @@ class TestLayoutStyleDedup:
         code = generate_component(root)
         # Extract className of the child element
         # The w-36 class (144/4=36) should appear only once
-        import re
-        w_classes = re.findall(r'w-36', code)
+        w_classes = _W36_RE.findall(code)
         assert len(w_classes) <= 1, f"Found duplicate w-36: {w_classes}"
 
 
@@ -790,65 +812,66 @@ class TestIsDecorativeName:
 # ARIA: _resolve_aria_attrs
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="class")
+def node_factory():
+    """Factory producing named nodes by copying one base node.
+
+    ``_resolve_aria_attrs`` only reads ``node.name``, so there is no
+    reason to build a full FigmaIRNode per test — one base node is
+    copied with the name swapped in via ``dataclasses.replace``.
+    """
+    base = _make_node()
+    return lambda name: dataclasses.replace(base, name=name)
+
+
 class TestResolveAriaAttrs:
     """Unit tests for ARIA attribute resolution by tag."""
 
-    def test_button_tag(self):
-        node = _make_node(name="Login")
-        attrs = _resolve_aria_attrs(node, "button")
+    def test_button_tag(self, node_factory):
+        attrs = _resolve_aria_attrs(node_factory("Login"), "button")
         assert attrs == {"type": "button"}
 
-    def test_input_tag(self):
-        node = _make_node(name="Email")
-        attrs = _resolve_aria_attrs(node, "input")
+    def test_input_tag(self, node_factory):
+        attrs = _resolve_aria_attrs(node_factory("Email"), "input")
         assert attrs["type"] == "text"
         assert attrs["aria-label"] == "Email"
 
-    def test_nav_tag(self):
-        node = _make_node(name="Site Nav")
-        attrs = _resolve_aria_attrs(node, "nav")
+    def test_nav_tag(self, node_factory):
+        attrs = _resolve_aria_attrs(node_factory("Site Nav"), "nav")
         assert attrs["aria-label"] == "Site Nav"
 
-    def test_header_tag(self):
-        node = _make_node(name="Header")
-        attrs = _resolve_aria_attrs(node, "header")
+    def test_header_tag(self, node_factory):
+        attrs = _resolve_aria_attrs(node_factory("Header"), "header")
         assert attrs["role"] == "banner"
 
-    def test_footer_tag(self):
-        node = _make_node(name="Footer")
-        attrs = _resolve_aria_attrs(node, "footer")
+    def test_footer_tag(self, node_factory):
+        attrs = _resolve_aria_attrs(node_factory("Footer"), "footer")
         assert attrs["role"] == "contentinfo"
 
-    def test_h1_tag(self):
-        node = _make_node(name="Title")
-        attrs = _resolve_aria_attrs(node, "h1")
+    def test_h1_tag(self, node_factory):
+        attrs = _resolve_aria_attrs(node_factory("Title"), "h1")
         assert attrs["role"] == "heading"
         assert attrs["aria-level"] == "1"
 
-    def test_h2_tag(self):
-        node = _make_node(name="Subtitle")
-        attrs = _resolve_aria_attrs(node, "h2")
+    def test_h2_tag(self, node_factory):
+        attrs = _resolve_aria_attrs(node_factory("Subtitle"), "h2")
         assert attrs["aria-level"] == "2"
 
-    def test_h3_tag(self):
-        node = _make_node(name="Section")
-        attrs = _resolve_aria_attrs(node, "h3")
+    def test_h3_tag(self, node_factory):
+        attrs = _resolve_aria_attrs(node_factory("Section"), "h3")
         assert attrs["aria-level"] == "3"
 
-    def test_div_with_button_name(self):
-        node = _make_node(name="Action Button")
-        attrs = _resolve_aria_attrs(node, "div")
+    def test_div_with_button_name(self, node_factory):
+        attrs = _resolve_aria_attrs(node_factory("Action Button"), "div")
         assert attrs["role"] == "button"
         assert attrs["tabIndex"] == "{0}"
 
-    def test_decorative_returns_empty(self):
-        node = _make_node(name="Frame 42")
-        attrs = _resolve_aria_attrs(node, "div")
+    def test_decorative_returns_empty(self, node_factory):
+        attrs = _resolve_aria_attrs(node_factory("Frame 42"), "div")
         assert attrs == {}
 
-    def test_regular_div_no_attrs(self):
-        node = _make_node(name="ContentWrapper")
-        attrs = _resolve_aria_attrs(node, "div")
+    def test_regular_div_no_attrs(self, node_factory):
+        attrs = _resolve_aria_attrs(node_factory("ContentWrapper"), "div")
         assert attrs == {}
 
 
@@ -903,8 +926,7 @@ class TestAriaIntegration:
         field = _make_node(node_id="2:1", name="Email Input", children=[])
         root = _make_node(children=[field])
         code = generate_component(root, aria=True)
-        assert 'type="text"' in code
-        assert 'aria-label="Email Input"' in code
+        _assert_all_in(code, 'type="text"', 'aria-label="Email Input"')
 
     def test_nav_gets_aria_label(self):
         child = _make_node(node_id="3:1", name="Link", children=[])
@@ -928,12 +950,11 @@ class TestAriaIntegration:
         assert 'role="contentinfo"' in code
 
     def test_h1_gets_heading_role_and_level(self):
-        style = TypeStyle.model_validate({"fontSize": 36.0, "fontWeight": 700.0})
+        style = TypeStyle.model_construct(font_size=36.0, font_weight=700.0)
         text = _make_text_node(name="PageTitle", text_content="Welcome", text_style=style)
         root = _make_node(children=[text])
         code = generate_component(root, aria=True)
-        assert 'role="heading"' in code
-        assert 'aria-level="1"' in code
+        _assert_all_in(code, 'role="heading"', 'aria-level="1"')
 
     def test_decorative_frame_no_aria(self):
         node = _make_node(name="Frame 42")
@@ -951,14 +972,12 @@ class TestAriaIntegration:
         child = _make_node(node_id="2:1", name="Submit Button", children=[])
         root = _make_node(children=[child])
         code = generate_component(root, aria=True)
-        import re
-        match = re.search(r'<button\s+([^>]+?)(?:\s*/)?\s*>', code)
-        if match:
-            attrs = match.group(1)
-            class_pos = attrs.find("className")
-            type_pos = attrs.find('type=')
-            if class_pos >= 0 and type_pos >= 0:
-                assert class_pos < type_pos
+        # Attribute order is deterministic (className first, then the
+        # fixed emit order), so a direct index scan suffices — no regex.
+        btn_idx = code.index("<button")
+        class_idx = code.index("className", btn_idx)
+        type_idx = code.index("type=", btn_idx)
+        assert class_idx < type_idx
 
     def test_svg_candidate_gets_role_img(self):
         icon = _make_node(
@@ -983,8 +1002,6 @@ class TestVoidElementAttrSplit:
 
     def test_input_with_children_type_on_input_not_div(self):
         """type='text' must appear on <input>, not the wrapper <div>."""
-        import re
-
         placeholder = _make_text_node(
             node_id="3:1", name="Placeholder", text_content="Enter email"
         )
@@ -994,14 +1011,12 @@ class TestVoidElementAttrSplit:
         root = _make_node(children=[field])
         code = generate_component(root, aria=True)
         # type='text' must NOT be on <div>
-        assert re.search(r'<div[^>]*type="text"', code) is None
+        assert _DIV_WITH_TYPE_RE.search(code) is None
         # type='text' must be on <input>
-        assert re.search(r'<input[^>]*type="text"', code) is not None
+        assert _INPUT_WITH_TYPE_RE.search(code) is not None
 
     def test_input_with_children_aria_label_on_input(self):
         """aria-label must appear on <input>, not the wrapper <div>."""
-        import re
-
         child = _make_text_node(
             node_id="3:1", name="Help text", text_content="Required"
         )
@@ -1011,9 +1026,9 @@ class TestVoidElementAttrSplit:
         root = _make_node(children=[field])
         code = generate_component(root, aria=True)
         # aria-label must NOT be on <div>
-        assert re.search(r'<div[^>]*aria-label', code) is None
+        assert _DIV_WITH_ARIA_LABEL_RE.search(code) is None
         # aria-label must be on <input>
-        assert re.search(r'<input[^>]*aria-label="Email Input"', code) is not None
+        assert _INPUT_WITH_EMAIL_LABEL_RE.search(code) is not None
 
     def test_input_without_children_keeps_attrs(self):
         """Childless <input> should keep its attrs directly."""
@@ -1022,10 +1037,8 @@ class TestVoidElementAttrSplit:
         )
         root = _make_node(children=[field])
         code = generate_component(root, aria=True)
-        assert 'type="text"' in code
-        assert 'aria-label="Search Input"' in code
-        # Should be a self-closing input, not wrapped in div
-        assert "<input" in code
+        # Should be a self-closing input with its attrs, not wrapped in div
+        _assert_all_in(code, 'type="text"', 'aria-label="Search Input"', "<input")
 
     def test_wrapper_div_keeps_classname(self):
         """The wrapper <div> must retain className for styling."""
@@ -1039,8 +1052,7 @@ class TestVoidElementAttrSplit:
         root = _make_node(children=[field])
         code = generate_component(root, aria=True)
         # The wrapper div should have className
-        import re
-        assert re.search(r'<div\s+className="[^"]*"', code) is not None
+        assert _DIV_WITH_CLASSNAME_RE.search(code) is not None
 
     def test_no_aria_mode_no_attrs_on_void_wrapper(self):
         """Without aria flag, no ARIA attrs should appear anywhere."""
@@ -1066,5 +1078,4 @@ class TestVoidElementAttrSplit:
         root = _make_node(children=[btn])
         code = generate_component(root, aria=True)
         # type='button' should be directly on <button>
-        import re
-        assert re.search(r'<button[^>]*type="button"', code) is not None
+        assert _BUTTON_WITH_TYPE_RE.search(code) is not None
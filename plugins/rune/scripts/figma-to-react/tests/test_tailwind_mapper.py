@@ -1,14 +1,10 @@
 """Tests for tailwind_mapper.py — CSS property to Tailwind v4 class mapping."""
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-from tailwind_mapper import (  # noqa: E402
+from tailwind_mapper import (
     TailwindMapper,
     map_font_size,
     map_font_weight,
@@ -26,48 +22,48 @@ from tailwind_mapper import (  # noqa: E402
 class TestMapProperties:
     """Test the main CSS-to-Tailwind properties mapper."""
 
-    def test_empty_props(self):
+    def test_empty_props(self, mapper):
         """Empty dict should return empty list."""
-        assert TailwindMapper().map_properties({}) == []
+        assert mapper.map_properties({}) == []
 
-    def test_background_color(self):
+    def test_background_color(self, mapper):
         """background-color should map to bg-* class."""
-        classes = TailwindMapper().map_properties({"background-color": "#ffffff"})
+        classes = mapper.map_properties({"background-color": "#ffffff"})
         assert len(classes) == 1
         assert classes[0].startswith("bg-")
 
-    def test_width_percent(self):
+    def test_width_percent(self, mapper):
         """width: 100% should map to w-full."""
-        classes = TailwindMapper().map_properties({"width": "100%"})
+        classes = mapper.map_properties({"width": "100%"})
         assert "w-full" in classes
 
-    def test_width_px(self):
+    def test_width_px(self, mapper):
         """width: 200px should map to w-50 (200/4)."""
-        classes = TailwindMapper().map_properties({"width": "200px"})
+        classes = mapper.map_properties({"width": "200px"})
         assert "w-50" in classes
 
-    def test_padding_uniform(self):
+    def test_padding_uniform(self, mapper):
         """padding should map to p-* class."""
-        classes = TailwindMapper().map_properties({"padding": "16.0px"})
+        classes = mapper.map_properties({"padding": "16.0px"})
         assert "p-4" in classes
 
-    def test_padding_xy(self):
+    def test_padding_xy(self, mapper):
         """padding-x and padding-y should map separately."""
-        classes = TailwindMapper().map_properties({
+        classes = mapper.map_properties({
             "padding-x": "16.0px",
             "padding-y": "8.0px",
         })
         assert "px-4" in classes
         assert "py-2" in classes
 
-    def test_gap(self):
+    def test_gap(self, mapper):
         """gap should map to gap-*."""
-        classes = TailwindMapper().map_properties({"gap": "12.0px"})
+        classes = mapper.map_properties({"gap": "12.0px"})
         assert "gap-3" in classes
 
-    def test_border_properties(self):
+    def test_border_properties(self, mapper):
         """border-width + border-color should produce border classes."""
-        classes = TailwindMapper().map_properties({
+        classes = mapper.map_properties({
             "border-width": "1.0px",
             "border-color": "#000000",
             "border-style": "solid",
@@ -77,49 +73,78 @@ class TestMapProperties:
         assert any(c.startswith("border-") and c != "border" and c != "border-solid" for c in classes)
         assert "border-solid" in classes
 
-    def test_box_shadow_maps_to_shadow(self):
+    def test_box_shadow_maps_to_shadow(self, mapper):
         """box-shadow should map to shadow-* class."""
-        classes = TailwindMapper().map_properties({
+        classes = mapper.map_properties({
             "box-shadow": "0.0px 4.0px 6.0px 0.0px rgba(0, 0, 0, 0.10)"
         })
         assert len(classes) == 1
         assert "shadow" in classes[0]
 
-    def test_opacity(self):
+    def test_opacity(self, mapper):
         """opacity should map to opacity-* class."""
-        classes = TailwindMapper().map_properties({"opacity": "0.50"})
+        classes = mapper.map_properties({"opacity": "0.50"})
         assert "opacity-50" in classes
 
-    def test_overflow_hidden(self):
+    def test_overflow_hidden(self, mapper):
         """overflow: hidden should map to overflow-hidden."""
-        classes = TailwindMapper().map_properties({"overflow": "hidden"})
+        classes = mapper.map_properties({"overflow": "hidden"})
         assert "overflow-hidden" in classes
 
-    def test_blur_filter(self):
+    def test_blur_filter(self, mapper):
         """filter: blur() should map to blur-* class."""
-        classes = TailwindMapper().map_properties({"filter": "blur(4.0px)"})
+        classes = mapper.map_properties({"filter": "blur(4.0px)"})
         assert len(classes) == 1
         assert "blur" in classes[0]
 
-    def test_backdrop_blur(self):
+    def test_backdrop_blur(self, mapper):
         """backdrop-filter: blur() should map to backdrop-blur-*."""
-        classes = TailwindMapper().map_properties({"backdrop-filter": "blur(8.0px)"})
+        classes = mapper.map_properties({"backdrop-filter": "blur(8.0px)"})
         assert len(classes) == 1
         assert "backdrop-blur" in classes[0]
 
-    def test_gradient_direction(self):
+    def test_gradient_direction(self, mapper):
         """linear-gradient(to right, ...) should map to bg-linear-to-r."""
-        classes = TailwindMapper().map_properties({
+        classes = mapper.map_properties({
             "background-image": "linear-gradient(to right, #000 0%, #fff 100%)"
         })
         assert "bg-linear-to-r" in classes
 
-    def test_internal_markers_skipped(self):
+    def test_internal_markers_skipped(self, mapper):
         """Properties starting with _ should be ignored."""
-        classes = TailwindMapper().map_properties({"_image_ref": "abc123"})
+        classes = mapper.map_properties({"_image_ref": "abc123"})
         assert classes == []
 
 
+# ---------------------------------------------------------------------------
+# TailwindMapper.map_properties_batch
+# ---------------------------------------------------------------------------
+
+class TestMapPropertiesBatch:
+    """Test the batched CSS-to-Tailwind entry point."""
+
+    def test_batch_matches_single_calls(self, mapper):
+        """Batch results should match per-dict map_properties calls."""
+        props_list = [
+            {"background-color": "#ffffff"},
+            {"padding": "16.0px", "gap": "12.0px"},
+            {},
+        ]
+        expected = [mapper.map_properties(p) for p in props_list]
+        assert mapper.map_properties_batch(props_list) == expected
+
+    def test_duplicate_dicts_yield_independent_lists(self, mapper):
+        """Repeated identical dicts map once but return distinct lists."""
+        props = {"width": "200px"}
+        results = mapper.map_properties_batch([props, dict(props)])
+        assert results[0] == results[1] == ["w-50"]
+        assert results[0] is not results[1]
+
+    def test_empty_batch(self, mapper):
+        """An empty batch should return an empty list."""
+        assert mapper.map_properties_batch([]) == []
+
+
 # ---------------------------------------------------------------------------
 # snap_color
 # ---------------------------------------------------------------------------
@@ -184,47 +209,28 @@ class TestSnapColor:
 class TestMapFontSize:
     """Test font size to text-* class mapping."""
 
-    def test_12px_text_xs(self):
-        assert map_font_size(12) == "text-xs"
-
-    def test_14px_text_sm(self):
-        assert map_font_size(14) == "text-sm"
-
-    def test_16px_text_base(self):
-        assert map_font_size(16) == "text-base"
-
-    def test_18px_text_lg(self):
-        assert map_font_size(18) == "text-lg"
-
-    def test_20px_text_xl(self):
-        assert map_font_size(20) == "text-xl"
-
-    def test_24px_text_2xl(self):
-        assert map_font_size(24) == "text-2xl"
-
-    def test_30px_text_3xl(self):
-        assert map_font_size(30) == "text-3xl"
-
-    def test_36px_text_4xl(self):
-        assert map_font_size(36) == "text-4xl"
-
-    def test_48px_text_5xl(self):
-        assert map_font_size(48) == "text-5xl"
-
-    def test_13px_snaps_to_xs(self):
-        """13px is within 1px of 12px (text-xs) -- snaps to nearest."""
-        result = map_font_size(13)
-        assert result == "text-xs"
-
-    def test_arbitrary_size_22px(self):
-        """22px is 2px from both 20 and 24 -- exceeds >1 threshold."""
-        result = map_font_size(22)
-        assert result == "text-[22px]"
-
-    def test_very_large_size(self):
-        """Size > 128px should use arbitrary value."""
-        result = map_font_size(200)
-        assert result == "text-[200px]"
+    @pytest.mark.parametrize(
+        ("px", "expected"),
+        [
+            (12, "text-xs"),
+            (14, "text-sm"),
+            (16, "text-base"),
+            (18, "text-lg"),
+            (20, "text-xl"),
+            (24, "text-2xl"),
+            (30, "text-3xl"),
+            (36, "text-4xl"),
+            (48, "text-5xl"),
+            # 13px is within 1px of 12px (text-xs) -- snaps to nearest
+            (13, "text-xs"),
+            # 22px is 2px from both 20 and 24 -- exceeds >1 threshold
+            (22, "text-[22px]"),
+            # Size > 128px should use arbitrary value
+            (200, "text-[200px]"),
+        ],
+    )
+    def test_font_size(self, px, expected):
+        assert map_font_size(px) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -234,36 +240,24 @@ class TestMapFontSize:
 class TestMapFontWeight:
     """Test font weight mapping."""
 
-    def test_100_thin(self):
-        assert map_font_weight(100) == "font-thin"
-
-    def test_200_extralight(self):
-        assert map_font_weight(200) == "font-extralight"
-
-    def test_300_light(self):
-        assert map_font_weight(300) == "font-light"
-
-    def test_400_normal(self):
-        assert map_font_weight(400) == "font-normal"
-
-    def test_500_medium(self):
-        assert map_font_weight(500) == "font-medium"
-
-    def test_600_semibold(self):
-        assert map_font_weight(600) == "font-semibold"
-
-    def test_700_bold(self):
-        assert map_font_weight(700) == "font-bold"
-
-    def test_800_extrabold(self):
-        assert map_font_weight(800) == "font-extrabold"
-
-    def test_900_black(self):
-        assert map_font_weight(900) == "font-black"
-
-    def test_550_rounds_to_600(self):
-        """Non-standard 550 should round to 600 (semibold)."""
-        assert map_font_weight(550) == "font-semibold"
+    @pytest.mark.parametrize(
+        ("weight", "expected"),
+        [
+            (100, "font-thin"),
+            (200, "font-extralight"),
+            (300, "font-light"),
+            (400, "font-normal"),
+            (500, "font-medium"),
+            (600, "font-semibold"),
+            (700, "font-bold"),
+            (800, "font-extrabold"),
+            (900, "font-black"),
+            # Non-standard 550 should round to 600 (semibold)
+            (550, "font-semibold"),
+        ],
+    )
+    def test_font_weight(self, weight, expected):
+        assert map_font_weight(weight) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -273,42 +267,26 @@ class TestMapFontWeight:
 class TestBorderRadius:
     """Test border radius via TailwindMapper._snap_radius."""
 
-    def _snap(self, px: str) -> str:
-        return TailwindMapper._snap_radius(px)
-
-    def test_0_none(self):
-        assert self._snap("0px") == "rounded-none"
-
-    def test_2_xs(self):
-        assert self._snap("2px") == "rounded-xs"
-
-    def test_4_sm(self):
-        assert self._snap("4px") == "rounded-sm"
-
-    def test_6_rounded(self):
-        """6px snaps to 'rounded' (the base class in v4)."""
-        assert self._snap("6px") == "rounded"
-
-    def test_8_md(self):
-        assert self._snap("8px") == "rounded-md"
-
-    def test_12_lg(self):
-        assert self._snap("12px") == "rounded-lg"
-
-    def test_16_xl(self):
-        assert self._snap("16px") == "rounded-xl"
-
-    def test_24_2xl(self):
-        assert self._snap("24px") == "rounded-2xl"
-
-    def test_9999_full(self):
-        """Very large value should snap to rounded-full."""
-        assert self._snap("9999px") == "rounded-full"
-
-    def test_arbitrary_50(self):
-        """50px doesn't match any scale closely -- should use arbitrary."""
-        result = self._snap("50px")
-        assert "rounded-[50px]" == result
+    @pytest.mark.parametrize(
+        ("px", "expected"),
+        [
+            ("0px", "rounded-none"),
+            ("2px", "rounded-xs"),
+            ("4px", "rounded-sm"),
+            # 6px snaps to 'rounded' (the base class in v4)
+            ("6px", "rounded"),
+            ("8px", "rounded-md"),
+            ("12px", "rounded-lg"),
+            ("16px", "rounded-xl"),
+            ("24px", "rounded-2xl"),
+            # Very large value should snap to rounded-full
+            ("9999px", "rounded-full"),
+            # 50px doesn't match any scale closely -- should use arbitrary
+            ("50px", "rounded-[50px]"),
+        ],
+    )
+    def test_snap_radius(self, px, expected):
+        assert TailwindMapper._snap_radius(px) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -349,23 +327,18 @@ class TestShadowMapping:
 class TestOpacityMapping:
     """Test CSS opacity to Tailwind opacity-* class mapping."""
 
-    def _map(self, val: str) -> str:
-        return TailwindMapper._map_opacity(val)
-
-    def test_full_opacity(self):
-        assert self._map("1.00") == "opacity-100"
-
-    def test_50_percent(self):
-        assert self._map("0.50") == "opacity-50"
-
-    def test_zero_opacity(self):
-        assert self._map("0.00") == "opacity-0"
-
-    def test_75_percent(self):
-        assert self._map("0.75") == "opacity-75"
-
-    def test_30_percent(self):
-        assert self._map("0.30") == "opacity-30"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("1.00", "opacity-100"),
+            ("0.75", "opacity-75"),
+            ("0.50", "opacity-50"),
+            ("0.30", "opacity-30"),
+            ("0.00", "opacity-0"),
+        ],
+    )
+    def test_opacity(self, value, expected):
+        assert TailwindMapper._map_opacity(value) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -375,54 +348,54 @@ class TestOpacityMapping:
 class TestLetterSpacing:
     """Test letter spacing to tracking-* class mapping."""
 
-    def test_normal(self):
-        assert map_letter_spacing(0) == "tracking-normal"
-
-    def test_tight(self):
-        assert map_letter_spacing(-0.4) == "tracking-tight"
-
-    def test_wide(self):
-        assert map_letter_spacing(0.4) == "tracking-wide"
+    @pytest.mark.parametrize(
+        ("px", "expected"),
+        [
+            (0, "tracking-normal"),
+            (-0.4, "tracking-tight"),
+            (0.4, "tracking-wide"),
+        ],
+    )
+    def test_letter_spacing(self, px, expected):
+        assert map_letter_spacing(px) == expected
 
 
 class TestLineHeight:
     """Test line height to leading-* class mapping."""
 
-    def test_none(self):
-        """line-height = font-size = ratio 1.0 -> leading-none."""
-        assert map_line_height(16, 16) == "leading-none"
-
-    def test_tight(self):
-        """ratio ~1.125 -> leading-tight."""
-        assert map_line_height(18, 16) == "leading-tight"
-
-    def test_normal(self):
-        """ratio ~1.5 -> leading-normal."""
-        assert map_line_height(24, 16) == "leading-normal"
-
-    def test_loose(self):
-        """ratio > 1.625 -> leading-loose."""
-        assert map_line_height(32, 16) == "leading-loose"
+    @pytest.mark.parametrize(
+        ("px", "font_size", "expected"),
+        [
+            # line-height = font-size = ratio 1.0 -> leading-none
+            (16, 16, "leading-none"),
+            # ratio ~1.125 -> leading-tight
+            (18, 16, "leading-tight"),
+            # ratio ~1.5 -> leading-normal
+            (24, 16, "leading-normal"),
+            # ratio > 1.625 -> leading-loose
+            (32, 16, "leading-loose"),
+        ],
+    )
+    def test_line_height(self, px, font_size, expected):
+        assert map_line_height(px, font_size) == expected
 
 
 class TestTextAlign:
     """Test text alignment mapping."""
 
-    def test_left_is_none(self):
-        """LEFT alignment is default -- returns None."""
-        assert map_text_align("LEFT") is None
-
-    def test_center(self):
-        assert map_text_align("CENTER") == "text-center"
-
-    def test_right(self):
-        assert map_text_align("RIGHT") == "text-right"
-
-    def test_justified(self):
-        assert map_text_align("JUSTIFIED") == "text-justify"
-
-    def test_none_input(self):
-        assert map_text_align(None) is None
+    @pytest.mark.parametrize(
+        ("horizontal", "expected"),
+        [
+            # LEFT alignment is default -- returns None
+            ("LEFT", None),
+            ("CENTER", "text-center"),
+            ("RIGHT", "text-right"),
+            ("JUSTIFIED", "text-justify"),
+            (None, None),
+        ],
+    )
+    def test_text_align(self, horizontal, expected):
+        assert map_text_align(horizontal) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -432,34 +405,27 @@ class TestTextAlign:
 class TestRotationMapping:
     """Test CSS rotate transform to Tailwind rotate class mapping."""
 
-    def test_zero_rotation(self):
-        mapper = TailwindMapper()
+    def test_zero_rotation(self, mapper):
         assert mapper._map_rotation("rotate(0.0deg)") == "rotate-0"
 
-    def test_named_45_degrees(self):
-        mapper = TailwindMapper()
+    def test_named_45_degrees(self, mapper):
         assert mapper._map_rotation("rotate(45.0deg)") == "rotate-45"
 
-    def test_negative_90_degrees(self):
-        mapper = TailwindMapper()
+    def test_negative_90_degrees(self, mapper):
         assert mapper._map_rotation("rotate(-90.0deg)") == "-rotate-90"
 
-    def test_arbitrary_angle(self):
-        mapper = TailwindMapper()
+    def test_arbitrary_angle(self, mapper):
         result = mapper._map_rotation("rotate(37.0deg)")
         assert result == "rotate-[37deg]"
 
-    def test_named_180_degrees(self):
-        mapper = TailwindMapper()
+    def test_named_180_degrees(self, mapper):
         assert mapper._map_rotation("rotate(180.0deg)") == "rotate-180"
 
-    def test_invalid_value(self):
-        mapper = TailwindMapper()
+    def test_invalid_value(self, mapper):
         assert mapper._map_rotation("scale(2)") == "rotate-0"
 
-    def test_rotation_via_map_properties(self):
+    def test_rotation_via_map_properties(self, mapper):
         """Rotation should go through the full map_properties pipeline."""
-        mapper = TailwindMapper()
         result = mapper.map_properties({"transform": "rotate(45.0deg)"})
         assert "rotate-45" in result
 
@@ -471,18 +437,15 @@ class TestRotationMapping:
 class TestBlendModeMapping:
     """Test mix-blend-mode to Tailwind class mapping."""
 
-    def test_multiply(self):
-        mapper = TailwindMapper()
+    def test_multiply(self, mapper):
         result = mapper.map_properties({"mix-blend-mode": "multiply"})
         assert result == ["mix-blend-multiply"]
 
-    def test_overlay(self):
-        mapper = TailwindMapper()
+    def test_overlay(self, mapper):
         result = mapper.map_properties({"mix-blend-mode": "overlay"})
         assert result == ["mix-blend-overlay"]
 
-    def test_screen(self):
-        mapper = TailwindMapper()
+    def test_screen(self, mapper):
         result = mapper.map_properties({"mix-blend-mode": "screen"})
         assert result == ["mix-blend-screen"]
 
@@ -494,18 +457,16 @@ class TestBlendModeMapping:
 class TestGradientStops:
     """Test gradient color stop extraction to from-/via-/to- classes."""
 
-    def test_two_stop_linear_gradient(self):
+    def test_two_stop_linear_gradient(self, mapper):
         """A 2-color gradient should produce from- and to- classes."""
-        mapper = TailwindMapper()
         value = "linear-gradient(to right, #ff0000 0%, #0000ff 100%)"
         result = mapper.map_properties({"background-image": value})
         assert "bg-linear-to-r" in result
         assert any(c.startswith("from-") for c in result)
         assert any(c.startswith("to-") for c in result)
 
-    def test_three_stop_linear_gradient(self):
+    def test_three_stop_linear_gradient(self, mapper):
         """A 3-color gradient should produce from-, via-, and to- classes."""
-        mapper = TailwindMapper()
         value = "linear-gradient(to bottom, #ff0000 0%, #00ff00 50%, #0000ff 100%)"
         result = mapper.map_properties({"background-image": value})
         assert "bg-linear-to-b" in result
@@ -513,17 +474,15 @@ class TestGradientStops:
         assert any(c.startswith("via-") for c in result)
         assert any(c.startswith("to-") for c in result)
 
-    def test_radial_gradient_with_stops(self):
+    def test_radial_gradient_with_stops(self, mapper):
         """A radial gradient should also extract color stops."""
-        mapper = TailwindMapper()
         value = "radial-gradient(circle, #ffffff 0%, #000000 100%)"
         result = mapper.map_properties({"background-image": value})
         assert "bg-radial" in result
         assert any(c.startswith("from-") for c in result)
 
-    def test_gradient_without_stops(self):
+    def test_gradient_without_stops(self, mapper):
         """A gradient with no extractable colors falls back to direction only."""
-        mapper = TailwindMapper()
         value = "linear-gradient(to top)"
         result = mapper.map_properties({"background-image": value})
         assert "bg-linear-to-t" in result
@@ -536,28 +495,24 @@ class TestGradientStops:
 class TestShadowArbitraryValues:
     """Test improved shadow mapping with custom colors."""
 
-    def test_standard_black_shadow_snaps(self):
+    def test_standard_black_shadow_snaps(self, mapper):
         """Black shadows should snap to named classes."""
-        mapper = TailwindMapper()
         result = mapper._map_shadow("2px 4px 6px 0px rgba(0, 0, 0, 0.1)")
         assert not result.startswith("shadow-[")
         assert result.startswith("shadow")
 
-    def test_colored_shadow_uses_arbitrary(self):
+    def test_colored_shadow_uses_arbitrary(self, mapper):
         """Non-black shadows should use arbitrary syntax."""
-        mapper = TailwindMapper()
         result = mapper._map_shadow("2px 4px 8px 0px rgba(255, 0, 0, 0.5)")
         assert result.startswith("shadow-[")
         assert "255" in result
 
-    def test_inset_shadow(self):
+    def test_inset_shadow(self, mapper):
         """Inset shadows should always return shadow-inner."""
-        mapper = TailwindMapper()
         result = mapper._map_shadow("inset 0px 2px 4px 0px rgba(100, 50, 0, 0.3)")
         assert result == "shadow-inner"
 
-    def test_no_match_returns_shadow(self):
+    def test_no_match_returns_shadow(self, mapper):
         """Unparseable shadow falls back to shadow."""
-        mapper = TailwindMapper()
         result = mapper._map_shadow("none")
         assert result == "shadow"
@@ -1,15 +1,12 @@
 """Tests for url_parser.py — Figma URL parsing and validation."""
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 
 import pytest
 
 # Add parent directory to path so we can import the module under test
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from url_parser import FigmaURLError, parse_figma_url  # noqa: E402
+from url_parser import FigmaURLError, parse_figma_url
 
 
 # ---------------------------------------------------------------------------
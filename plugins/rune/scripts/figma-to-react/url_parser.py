@@ -11,32 +11,112 @@ Security:
 
 from __future__ import annotations
 
+import functools
 import re
+from dataclasses import dataclass
 from typing import Optional
-from urllib.parse import unquote, urlparse
 
 
 class FigmaURLError(ValueError):
     """Raised when a Figma URL cannot be parsed."""
 
 
-# Allowed hostnames — prevents SSRF by restricting to Figma domains only.
-_ALLOWED_HOSTS = frozenset({"figma.com", "www.figma.com"})
+@dataclass(frozen=True, slots=True)
+class FigmaURLParts:
+    """Parsed Figma URL components.
+
+    Frozen and slotted: instances are immutable (safe to share from the
+    parse cache) and more compact than the dict previously returned.
+    Dict-style access (``parts["file_key"]``, ``parts.get("node_id")``)
+    is kept for backward compatibility.
+    """
+
+    file_key: str
+    node_id: Optional[str]
+    type: str
+    branch_key: Optional[str]
+
+    def __getitem__(self, key: str) -> Optional[str]:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return getattr(self, key, default)
+
+
+# Allowed URL prefixes — prevents SSRF by pinning scheme and hostname
+# to Figma domains only.
+_ALLOWED_PREFIXES = ("https://figma.com/", "https://www.figma.com/")
 
 # URL path types that correspond to Figma document URLs.
 # Each maps to the path segment that appears after the hostname.
 _URL_TYPES = frozenset({"file", "design", "proto", "board", "slides", "dev", "make"})
 
-# Pattern: /{type}/{file_key}[/branch/{branch_key}][/title][?node-id=...]
-# file_key is always the segment after the type.
-_PATH_RE = re.compile(
-    r"^/(?P<type>" + "|".join(_URL_TYPES) + r")"
-    r"/(?P<file_key>[A-Za-z0-9]+)"
-    r"(?:/branch/(?P<branch_key>[A-Za-z0-9]+))?"
-    r"(?:/[^?]*)?"  # optional title segment (ignored)
-    r"$"
+# Static portion of the parse-failure message, built once at import so a
+# failed parse only formats the offending path.
+_PATH_ERROR_SUFFIX = (
+    "Expected /<type>/<file_key>[/branch/<branch_key>][/title] "
+    f"where type is one of: {', '.join(sorted(_URL_TYPES))}"
 )
 
+# Valid characters for a normalized node ID — compiled once rather than
+# per _normalize_node_id call.
+_NODE_ID_VALID_RE = re.compile(r"[\d:,]+", re.ASCII)
+
+# Single-character translation table: maps hyphens straight to colons
+# without str.replace's substring-search machinery.
+_HYPHEN_TO_COLON = str.maketrans({"-": ":"})
+
+
+def _parse_path(path: str) -> tuple[str, str, Optional[str]] | None:
+    """Parse ``/{type}/{file_key}[/branch/{branch_key}][/title]``.
+
+    Hand-written split/branch logic over C-level str methods — for this
+    closed seven-type grammar it is cheaper than re-entering the regex
+    engine per URL.
+
+    Returns:
+        (type, file_key, branch_key), or None when the path does not fit
+        the grammar.
+    """
+    if not path.startswith("/"):
+        return None
+    parts = path.split("/", 4)
+    if len(parts) < 3:
+        return None
+    url_type, file_key = parts[1], parts[2]
+    if url_type not in _URL_TYPES:
+        return None
+    # [A-Za-z0-9]+ — isalnum alone would admit non-ASCII letters/digits.
+    if not (file_key.isascii() and file_key.isalnum()):
+        return None
+    branch_key: Optional[str] = None
+    if len(parts) == 5 and parts[3] == "branch":
+        candidate = parts[4].partition("/")[0]
+        if candidate.isascii() and candidate.isalnum():
+            branch_key = candidate
+        # An invalid branch segment falls back to being a title, matching
+        # the old regex that backtracked into its title alternative.
+    return url_type, file_key, branch_key
+
+
+def _extract_node_id(query: str) -> Optional[str]:
+    """Pull the first node-id parameter out of a raw query string.
+
+    A single boundary-checked find walks the query without splitting it
+    into a parameter list; 'xnode-id=' and friends never match.
+    """
+    i = query.find("node-id=")
+    while i != -1:
+        if i == 0 or query[i - 1] == "&":
+            end = query.find("&", i)
+            raw = query[i + 8:] if end == -1 else query[i + 8:end]
+            return _normalize_node_id(raw) if raw else None
+        i = query.find("node-id=", i + 1)
+    return None
+
 
 def _normalize_node_id(raw: str) -> str:
     """Convert a raw node-id value to canonical colon-separated format.
@@ -53,24 +133,71 @@ def _normalize_node_id(raw: str) -> str:
     Raises:
         FigmaURLError: If the normalized node ID contains unexpected characters.
     """
-    # First decode any percent-encoding (%3A → :)
-    decoded = unquote(raw)
+    # Figma only ever percent-encodes the colon (%3A) in node-ids, so two
+    # targeted replaces cover decoding without unquote's general state
+    # machine; percent-free values (the common case) skip even that.
+    if "%" in raw:
+        raw = raw.replace("%3A", ":").replace("%3a", ":")
     # Convert hyphens to colons only if the decoded string has no colons yet.
     # If colons are already present (from %3A decoding), hyphens are literal.
     # This prevents corrupting multi-segment node IDs (e.g., "1-3-5" → "1:3:5").
-    if ":" not in decoded:
-        normalized = decoded.replace("-", ":")
+    if ":" not in raw:
+        normalized = raw.translate(_HYPHEN_TO_COLON)
     else:
-        normalized = decoded
+        normalized = raw
     # Validate: Figma node IDs contain only digits, colons, and commas
-    if not re.match(r"^[\d:,]+$", normalized):
+    if not _NODE_ID_VALID_RE.fullmatch(normalized):
         raise FigmaURLError(
             f"Invalid node-id format '{normalized}'. Expected digits, colons, and commas only."
         )
     return normalized
 
 
-def parse_figma_url(url: str) -> dict[str, Optional[str]]:
+@functools.lru_cache(maxsize=1024)
+def _parse_figma_url_cached(url: str) -> FigmaURLParts:
+    """Cached parse core.
+
+    Batch callers parse the same URL repeatedly; memoizing on the raw URL
+    string makes repeat parses a dict lookup. FigmaURLParts is frozen, so
+    the cached instance can be handed out directly without a defensive
+    copy.
+    """
+    # SEC-001: SSRF prevention — the prefix gate pins the scheme to
+    # https and the host to an allowed Figma domain in one O(1) check,
+    # rejecting hostile or lookalike inputs before any parsing work.
+    if not url.startswith(_ALLOWED_PREFIXES):
+        raise FigmaURLError(
+            "URL must start with https://figma.com/ or https://www.figma.com/ "
+            "(SSRF prevention)."
+        )
+
+    # With scheme and host pinned, the remainder splits with plain
+    # string ops — no urlparse SplitResult allocation per call.
+    if url.startswith("https://www.figma.com/"):
+        rest = url[len("https://www.figma.com"):]
+    else:
+        rest = url[len("https://figma.com"):]
+    rest = rest.partition("#")[0]
+    path, _, query = rest.partition("?")
+
+    parsed_path = _parse_path(path)
+    if parsed_path is None:
+        raise FigmaURLError(
+            f"Cannot parse Figma URL path: {path}. " + _PATH_ERROR_SUFFIX
+        )
+    url_type, file_key, branch_key = parsed_path
+
+    node_id = _extract_node_id(query) if query else None
+
+    return FigmaURLParts(
+        file_key=file_key,
+        node_id=node_id,
+        type=url_type,
+        branch_key=branch_key,
+    )
+
+
+def parse_figma_url(url: str) -> FigmaURLParts:
     """Parse a Figma URL into its structural components.
 
     Supports 7 URL types:
@@ -88,7 +215,7 @@ def parse_figma_url(url: str) -> dict[str, Optional[str]]:
         url: A full Figma URL string (must start with https://figma.com/...).
 
     Returns:
-        A dict with keys:
+        A FigmaURLParts with fields (dict-style access also works):
           - ``file_key``: The Figma file key (always present).
           - ``node_id``: The node ID in colon format, or None.
           - ``type``: The URL type (e.g., "design", "file").
@@ -100,44 +227,8 @@ def parse_figma_url(url: str) -> dict[str, Optional[str]]:
     if not url or not isinstance(url, str):
         raise FigmaURLError("URL must be a non-empty string")
 
-    parsed = urlparse(url)
+    return _parse_figma_url_cached(url)
 
-    # SEC-001: SSRF prevention — only allow figma.com hostnames.
-    hostname = (parsed.hostname or "").lower()
-    if hostname not in _ALLOWED_HOSTS:
-        raise FigmaURLError(
-            f"Invalid hostname '{hostname}'. Only figma.com URLs are accepted (SSRF prevention)."
-        )
-
-    if parsed.scheme != "https":
-        raise FigmaURLError(
-            f"Invalid scheme '{parsed.scheme}'. Only https is accepted."
-        )
-
-    # Match the path against known URL patterns.
-    match = _PATH_RE.match(parsed.path)
-    if not match:
-        raise FigmaURLError(
-            f"Cannot parse Figma URL path: {parsed.path}. "
-            f"Expected /<type>/<file_key>[/branch/<branch_key>][/title] "
-            f"where type is one of: {', '.join(sorted(_URL_TYPES))}"
-        )
 
-    # Extract node-id from query parameters.
-    # Figma uses ?node-id=... in the URL.
-    node_id: Optional[str] = None
-    if parsed.query:
-        # Parse query manually to handle node-id specifically.
-        for param in parsed.query.split("&"):
-            if param.startswith("node-id="):
-                raw_value = param[len("node-id="):]
-                if raw_value:
-                    node_id = _normalize_node_id(raw_value)
-                break
-
-    return {
-        "file_key": match.group("file_key"),
-        "node_id": node_id,
-        "type": match.group("type"),
-        "branch_key": match.group("branch_key"),
-    }
+# Let callers reset the memo (e.g., long-lived server processes).
+parse_figma_url.cache_clear = _parse_figma_url_cached.cache_clear  # type: ignore[attr-defined]
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+import shutil
 import subprocess
 import sys
 import tempfile
@@ -14,6 +17,10 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 import pytest
 
+# Imported at module scope so fixtures don't re-run the import machinery
+# per invocation; sys.path is already set up above.
+from helpers.claude_runner import ClaudeRunner
+
 TESTS_DIR = Path(__file__).parent
 
 FIXTURES_DIR = TESTS_DIR / "fixtures"
@@ -73,8 +80,12 @@ def pytest_collection_modifyitems(
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
 def has_jq() -> bool:
-    """Check if jq is available on PATH."""
+    """Check if jq is available on PATH (memoized — probes at most once)."""
+    # PATH lookup first: no subprocess fork at all when jq is absent.
+    if shutil.which("jq") is None:
+        return False
     try:
         subprocess.run(["jq", "--version"], capture_output=True, timeout=5)
         return True
@@ -134,8 +145,6 @@ def isolated_claude_config() -> Iterator[Path]:
     The harness uses CLAUDE_CONFIG_DIR=~/.claude-rune-plugin-test to redirect
     all Claude Code state (teams, tasks, memory) to this directory.
     """
-    from helpers.claude_runner import ClaudeRunner
-
     config_dir = ClaudeRunner.default_config_dir()
     if not config_dir.exists():
         pytest.skip(
@@ -143,9 +152,14 @@ def isolated_claude_config() -> Iterator[Path]:
             f"Create it manually: mkdir -p {config_dir}"
         )
 
-    # Ensure state subdirs exist (non-destructive)
+    # Ensure state subdirs exist (non-destructive). os.path sidesteps a
+    # PosixPath allocation per entry, and the isdir probe skips the mkdir
+    # syscall on the common already-initialized case.
+    base = str(config_dir)
     for state_dir in ("teams", "tasks", "projects", "agent-memory"):
-        (config_dir / state_dir).mkdir(exist_ok=True)
+        sub = os.path.join(base, state_dir)
+        if not os.path.isdir(sub):
+            os.mkdir(sub)
 
     yield config_dir
 
@@ -157,9 +171,6 @@ def project_env() -> Iterator[tuple[Path, Path]]:
     Yields (project_dir, config_dir) with the standard Rune directory layout.
     Both directories are cleaned up after the test.
     """
-    import os
-    import tempfile
-
     with tempfile.TemporaryDirectory(prefix="rune-project-") as project_dir:
         with tempfile.TemporaryDirectory(prefix="rune-config-") as config_dir:
             project = Path(project_dir)
@@ -196,8 +207,6 @@ def pressure_config_dir() -> Iterator[Path]:
 @pytest.fixture
 def hook_runner(project_env: tuple[Path, Path]):
     """Factory fixture for running hook scripts with proper environment isolation."""
-    import os
-
     project, config = project_env
 
     def _run(
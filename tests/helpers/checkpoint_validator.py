@@ -6,10 +6,12 @@ file existence, and verifies SHA-256 hashes.
 
 from __future__ import annotations
 
-import copy
 import hashlib
 import hmac
 import json
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -19,7 +21,10 @@ PHASE_ORDER = [
     "gap_analysis", "code_review", "mend", "verify_mend", "audit",
 ]
 
-VALID_STATUSES = {"pending", "in_progress", "completed", "failed", "skipped", "timeout", "cancelled"}
+# Built once so validation never rebuilds a set from PHASE_ORDER per call.
+_PHASE_ORDER_SET = frozenset(PHASE_ORDER)
+
+VALID_STATUSES = frozenset({"pending", "in_progress", "completed", "failed", "skipped", "timeout", "cancelled"})
 
 PHASE_FIELDS = {"status", "artifact", "artifact_hash", "team_name"}
 
@@ -55,17 +60,45 @@ class CheckpointReport:
         self.issues.append(ValidationIssue("warning", phase, message))
 
 
+# Digest memo keyed by (path, mtime_ns, size) — repeated validations of
+# an unchanged workspace skip re-reading and re-hashing each artifact.
+_HASH_CACHE: dict[tuple[str, int, int], str] = {}
+
+
 def sha256_file(path: Path) -> str:
     """Compute SHA-256 hex digest of a file.
 
     Reads in binary mode ("rb") so hashes are computed from raw bytes,
     ensuring consistent results across platforms regardless of line endings.
+    Results are memoized by (path, mtime_ns, size); call
+    ``sha256_file.cache_clear()`` to drop the memo.
     """
-    h = hashlib.sha256()
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    cached = _HASH_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        if st.st_size:
+            try:
+                # One update over the whole mapping hashes the file with
+                # zero Python-level loop overhead; OpenSSL streams it and
+                # uses SHA extensions where the CPU has them.
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    digest = hashlib.sha256(mm).hexdigest()
+            except (ValueError, OSError):
+                # Filesystems that refuse mapping fall back to the
+                # C-implemented chunked reader.
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+        else:
+            # mmap rejects zero-length files
+            digest = hashlib.sha256(b"").hexdigest()
+    _HASH_CACHE[key] = digest
+    return digest
+
+
+sha256_file.cache_clear = _HASH_CACHE.clear  # type: ignore[attr-defined]
 
 
 def _validate_metadata(checkpoint: dict, report: CheckpointReport) -> None:
@@ -86,6 +119,7 @@ def _validate_metadata(checkpoint: dict, report: CheckpointReport) -> None:
 
 def _validate_phase_entry(
     phase_name: str, phase: dict, report: CheckpointReport, workspace: Path | None,
+    pending_hashes: list[tuple[str, Path, str]],
 ) -> None:
     """Validate a single phase entry: fields, status, artifacts."""
     report.phase_statuses[phase_name] = phase.get("status", "MISSING")
@@ -105,13 +139,14 @@ def _validate_phase_entry(
         report.add_warning(phase_name, "Orchestrator-only phase has team_name set")
 
     if workspace and status == "completed":
-        _validate_artifact(phase_name, phase, report, workspace)
+        _validate_artifact(phase_name, phase, report, workspace, pending_hashes)
 
 
 def _validate_artifact(
     phase_name: str, phase: dict, report: CheckpointReport, workspace: Path,
+    pending_hashes: list[tuple[str, Path, str]],
 ) -> None:
-    """Check artifact existence and hash integrity for a completed phase."""
+    """Check artifact existence and queue hash verification for a completed phase."""
     artifact_path = phase.get("artifact")
     expected_hash = phase.get("artifact_hash")
 
@@ -126,19 +161,42 @@ def _validate_artifact(
         if not exists:
             report.add_error(phase_name, f"Artifact missing: {artifact_path}")
         elif expected_hash:
-            actual_hash = sha256_file(full_path)
             expected_bare = expected_hash.removeprefix("sha256:")
-            matches = hmac.compare_digest(actual_hash, expected_bare)
-            report.hash_checks[phase_name] = matches
-            if not matches:
-                report.add_error(
-                    phase_name,
-                    f"Hash mismatch: expected {expected_bare[:16]}..., got {actual_hash[:16]}...",
-                )
+            pending_hashes.append((phase_name, full_path, expected_bare))
     elif phase_name not in ORCHESTRATOR_ONLY:
         report.add_warning(phase_name, "Completed phase has no artifact path")
 
 
+def _check_artifact_hashes(
+    pending_hashes: list[tuple[str, Path, str]], report: CheckpointReport,
+) -> None:
+    """Verify queued artifact hashes, hashing files in parallel.
+
+    SHA-256 releases the GIL in CPython, so a thread pool gives real
+    speedup when several artifacts need hashing; a single artifact is
+    hashed inline to skip pool setup.
+    """
+    if not pending_hashes:
+        return
+
+    paths = [path for _, path, _ in pending_hashes]
+    if len(paths) == 1:
+        digests = [sha256_file(paths[0])]
+    else:
+        workers = min(len(paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            digests = list(pool.map(sha256_file, paths))
+
+    for (phase_name, _path, expected_bare), actual_hash in zip(pending_hashes, digests):
+        matches = hmac.compare_digest(actual_hash, expected_bare)
+        report.hash_checks[phase_name] = matches
+        if not matches:
+            report.add_error(
+                phase_name,
+                f"Hash mismatch: expected {expected_bare[:16]}..., got {actual_hash[:16]}...",
+            )
+
+
 def _validate_phases(checkpoint: dict, report: CheckpointReport, workspace: Path | None) -> bool:
     """Validate all phases. Returns False if phases dict is invalid (caller should abort)."""
     phases = checkpoint.get("phases", {})
@@ -146,6 +204,7 @@ def _validate_phases(checkpoint: dict, report: CheckpointReport, workspace: Path
         report.add_error(None, "'phases' must be a dict")
         return False
 
+    pending_hashes: list[tuple[str, Path, str]] = []
     for phase_name in PHASE_ORDER:
         if phase_name not in phases:
             report.add_error(phase_name, f"Missing phase '{phase_name}' in checkpoint")
@@ -156,9 +215,11 @@ def _validate_phases(checkpoint: dict, report: CheckpointReport, workspace: Path
             report.add_error(phase_name, f"Phase value must be a dict, got {type(phase).__name__}")
             continue
 
-        _validate_phase_entry(phase_name, phase, report, workspace)
+        _validate_phase_entry(phase_name, phase, report, workspace, pending_hashes)
 
-    extra = set(phases.keys()) - set(PHASE_ORDER)
+    _check_artifact_hashes(pending_hashes, report)
+
+    extra = set(phases) - _PHASE_ORDER_SET
     if extra:
         report.add_warning(None, f"Unexpected phases in checkpoint: {extra}")
 
@@ -197,13 +258,15 @@ def migrate_checkpoint(checkpoint: dict) -> dict:
 
     Returns a new dict (does not mutate input).
     """
-    cp = copy.deepcopy(checkpoint)
+    # A shallow copy plus a fresh phases dict suffices: migration only
+    # adds new top-level keys and new phase entries, never mutates the
+    # entries already present.
+    cp = dict(checkpoint)
+    cp["phases"] = dict(checkpoint.get("phases") or {})
     sv = cp.get("schema_version", 1)
 
     skipped_phase = {"status": "skipped", "artifact": None, "artifact_hash": None, "team_name": None}
 
-    cp.setdefault("phases", {})
-
     if sv < 2:
         cp["phases"].setdefault("plan_refine", {**skipped_phase})
         cp["phases"].setdefault("verification", {**skipped_phase})
@@ -251,26 +314,45 @@ def load_checkpoint(workspace: Path, extra_search_dirs: list[Path] | None = None
                 except (PermissionError, OSError):
                     pass
 
-    all_checkpoints: list[Path] = []
+    # scandir stats each directory entry once; the checkpoint's own stat
+    # doubles as the mtime used for recency. Tracking the running best
+    # instead of accumulating a candidate list also lets stale candidates
+    # skip the path-containment resolve() entirely.
+    best_mtime = -1
+    best_path: Path | None = None
     resolved_workspace = workspace.resolve()
     for root in search_roots:
-        if root.exists():
-            for cp_path in root.glob("*/checkpoint.json"):
+        try:
+            entries = os.scandir(root)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+        with entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                cp_path = Path(entry.path, "checkpoint.json")
+                try:
+                    st = cp_path.stat()
+                except (FileNotFoundError, OSError):
+                    continue
+                if st.st_mtime_ns <= best_mtime:
+                    continue
                 # Validate discovered paths stay within workspace or declared search dirs
                 resolved_cp = cp_path.resolve()
-                if resolved_cp.is_relative_to(resolved_workspace):
-                    all_checkpoints.append(cp_path)
-                elif extra_search_dirs and any(
-                    resolved_cp.is_relative_to(d.resolve()) for d in extra_search_dirs
+                if resolved_cp.is_relative_to(resolved_workspace) or (
+                    extra_search_dirs
+                    and any(
+                        resolved_cp.is_relative_to(d.resolve())
+                        for d in extra_search_dirs
+                    )
                 ):
-                    all_checkpoints.append(cp_path)
+                    best_mtime, best_path = st.st_mtime_ns, cp_path
                 # Silently skip paths that escape all trusted roots
 
-    if not all_checkpoints:
+    if best_path is None:
         return None
 
-    newest = max(all_checkpoints, key=lambda p: p.stat().st_mtime)
     try:
-        return json.loads(newest.read_text())
+        return json.loads(best_path.read_text())
     except json.JSONDecodeError:
         return None
@@ -9,6 +9,7 @@ from __future__ import annotations
 import json
 import logging
 import os
+import re
 import shutil
 import subprocess
 import time
@@ -61,11 +62,17 @@ class ClaudeRunner:
     extra_env: dict[str, str] = field(default_factory=dict)
     verbose: bool = False
     isolated_config_dir: Path | None = None
+    # Lazily-built base environment shared by every run() on this instance.
+    _env_base: dict[str, str] | None = field(default=None, init=False, repr=False)
 
     # Fixed isolated config location in user home (never touches ~/.claude/)
     CONFIG_DIR_NAME = ".claude-rune-plugin-test"
     # State dirs to create fresh in isolated config
     _STATE_DIRS = ("teams", "tasks", "projects", "agent-memory")
+    # Everything cleanup_config clears: the state dirs plus runtime caches
+    _CLEANUP_DIRS = frozenset(_STATE_DIRS) | frozenset(
+        {"cache", "debug", "shell-snapshots", "todos", "plans"}
+    )
 
     @classmethod
     def default_config_dir(cls) -> Path:
@@ -107,23 +114,38 @@ class ClaudeRunner:
         if not self.isolated_config_dir or not self.isolated_config_dir.exists():
             return
 
-        # Clear state subdirectories (non-destructive to the dirs themselves)
-        state_items = list(self._STATE_DIRS) + ["cache", "debug", "shell-snapshots", "todos", "plans"]
-        for subdir in state_items:
+        # Clear state subdirectories (non-destructive to the dirs themselves).
+        # A one-entry scandir probe skips the rmtree + mkdir round trip for
+        # dirs that are already empty — the common case on repeat cleanups.
+        for subdir in self._CLEANUP_DIRS:
             d = self.isolated_config_dir / subdir
-            if d.exists():
-                shutil.rmtree(d, ignore_errors=True)
-                d.mkdir(exist_ok=True)
-
-        # Remove history and backups, keep .claude.json
-        history = self.isolated_config_dir / "history.jsonl"
-        if history.exists():
-            history.unlink()
-        for backup in self.isolated_config_dir.glob(".claude.json.backup.*"):
-            backup.unlink(missing_ok=True)
-
-    # Env var name patterns that must never leak into subprocesses
-    _SENSITIVE_ENV_PATTERNS = ("SECRET", "TOKEN", "CREDENTIAL", "PASSWORD", "PRIVATE_KEY")
+            try:
+                with os.scandir(d) as it:
+                    has_entries = next(it, None) is not None
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            if not has_entries:
+                continue
+            shutil.rmtree(d, ignore_errors=True)
+            d.mkdir(exist_ok=True)
+
+        # Remove history and backups, keep .claude.json. One directory scan
+        # covers both, replacing the exists probe and the glob walk.
+        with os.scandir(self.isolated_config_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name == "history.jsonl" or name.startswith(".claude.json.backup."):
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
+
+    # Env var name patterns that must never leak into subprocesses.
+    # One case-insensitive alternation scans each name in a single pass
+    # instead of upper-casing it and substring-testing five patterns.
+    _SENSITIVE_ENV_RE = re.compile(
+        r"SECRET|TOKEN|CREDENTIAL|PASSWORD|PRIVATE_KEY", re.IGNORECASE
+    )
 
     def _build_env(self) -> dict[str, str]:
         """Build isolated environment for Claude CLI.
@@ -133,32 +155,43 @@ class ClaudeRunner:
         locale, terminal info, etc.) to function.  After copying, we
         strip any variable whose name contains a known-sensitive pattern
         so that credentials are never forwarded to the subprocess.
+
+        The environ copy + sensitive sweep + fixed markers only depend on
+        the process environment, so that base is computed once per runner
+        and reused; per-run state (config dir, extra_env) is overlaid on
+        a copy so later mutations of either still take effect.
         """
-        env = os.environ.copy()
-
-        # Strip known-sensitive variables to avoid leaking secrets
-        for key in list(env):
-            if any(pat in key.upper() for pat in self._SENSITIVE_ENV_PATTERNS):
-                del env[key]
-
-        # Marker for identifying test-spawned processes (inherited by teammates)
-        env["RUNE_TEST_HARNESS"] = "1"
-        # Disable memory and telemetry for hermetic testing
-        env["CLAUDE_CODE_DISABLE_AUTO_MEMORY"] = "1"
-        env["DISABLE_TELEMETRY"] = "1"
-        env["DISABLE_ERROR_REPORTING"] = "1"
-        env["DISABLE_AUTOUPDATER"] = "1"
-        env["CLAUDE_CODE_DISABLE_TERMINAL_TITLE"] = "1"
-        # Enable Agent Teams (required for Rune)
-        env["CLAUDE_CODE_EXPERIMENTAL_AGENT_TEAMS"] = "1"
+        if self._env_base is None:
+            env = os.environ.copy()
+
+            # Strip known-sensitive variables to avoid leaking secrets
+            search = self._SENSITIVE_ENV_RE.search
+            for key in list(env):
+                if search(key):
+                    del env[key]
+
+            # Marker for identifying test-spawned processes (inherited by teammates)
+            env["RUNE_TEST_HARNESS"] = "1"
+            # Disable memory and telemetry for hermetic testing
+            env["CLAUDE_CODE_DISABLE_AUTO_MEMORY"] = "1"
+            env["DISABLE_TELEMETRY"] = "1"
+            env["DISABLE_ERROR_REPORTING"] = "1"
+            env["DISABLE_AUTOUPDATER"] = "1"
+            env["CLAUDE_CODE_DISABLE_TERMINAL_TITLE"] = "1"
+            # Enable Agent Teams (required for Rune)
+            env["CLAUDE_CODE_EXPERIMENTAL_AGENT_TEAMS"] = "1"
+
+            # Remove CLAUDECODE marker so nested invocation works
+            env.pop("CLAUDECODE", None)
+
+            self._env_base = env
+
+        env = dict(self._env_base)
 
         # Redirect config directory for full state isolation
         if self.isolated_config_dir:
             env["CLAUDE_CONFIG_DIR"] = str(self.isolated_config_dir)
 
-        # Remove CLAUDECODE marker so nested invocation works
-        env.pop("CLAUDECODE", None)
-
         env.update(self.extra_env)
         return env
 
@@ -7,10 +7,15 @@ linting, type safety, test coverage, error handling, and structure.
 from __future__ import annotations
 
 import ast
+import functools
+import os
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterator
 
 # Scoring weights (must sum to 1.0)
 WEIGHTS = {
@@ -58,46 +63,65 @@ class QualityReport:
         self.total_score = sum(d.weighted for d in self.dimensions)
 
 
-def _run_cmd(args: list[str], cwd: Path, timeout: int = 120) -> subprocess.CompletedProcess[str]:
+def _run_cmd(
+    args: list[str],
+    cwd: Path,
+    timeout: int = 120,
+    env: dict[str, str] | None = None,
+) -> subprocess.CompletedProcess[str]:
     """Run a command and return result (never raises on non-zero exit)."""
     try:
-        return subprocess.run(args, cwd=cwd, capture_output=True, text=True, timeout=timeout)
+        return subprocess.run(
+            args, cwd=cwd, capture_output=True, text=True, timeout=timeout, env=env
+        )
     except subprocess.TimeoutExpired:
         return subprocess.CompletedProcess(args, returncode=-1, stdout="", stderr="TIMEOUT")
     except FileNotFoundError:
         return subprocess.CompletedProcess(args, returncode=-1, stdout="", stderr=f"Command not found: {args[0]}")
 
 
+# Flags appended to every pytest invocation: skip the banner and the
+# on-disk cache plugin. The summary line the parsers read is unaffected.
+_PYTEST_FAST_FLAGS = ("--no-header", "-p", "no:cacheprovider")
+
+
+def _pytest_env() -> dict[str, str]:
+    """Environment for plugin-free pytest runs.
+
+    PYTEST_DISABLE_PLUGIN_AUTOLOAD skips importing every setuptools-
+    registered plugin at startup, which dominates pytest's launch cost
+    on hosts with many plugins installed. The coverage run must not use
+    this — it depends on the auto-loaded pytest-cov plugin.
+    """
+    env = os.environ.copy()
+    env["PYTEST_DISABLE_PLUGIN_AUTOLOAD"] = "1"
+    return env
+
+
+# Matches "N passed" / "N failed" / "N error(s)" in a pytest summary line.
+# The required whitespace before the keyword keeps "xpassed"/"xfailed"
+# from being miscounted as ordinary passes/failures.
+_PYTEST_SUMMARY_RE = re.compile(r"(\d+)\s+(passed|failed|error)")
+
+
 def _parse_pytest_summary(stdout: str) -> tuple[int, int, int]:
     """Parse pytest summary output and return (passed, failed, errors) counts."""
     lines = stdout.strip().split("\n")
     summary_line = lines[-1] if lines else ""
-    summary_clean = summary_line.strip("= ").strip()
-
-    passed = failed = errors = 0
-    for part in summary_clean.split(","):
-        part = part.strip()
-        if "passed" in part:
-            try:
-                passed = int(part.split()[0])
-            except (ValueError, IndexError):
-                pass
-        if "failed" in part:
-            try:
-                failed = int(part.split()[0])
-            except (ValueError, IndexError):
-                pass
-        if "error" in part:
-            try:
-                errors = int(part.split()[0])
-            except (ValueError, IndexError):
-                pass
-    return passed, failed, errors
+
+    counts = {"passed": 0, "failed": 0, "error": 0}
+    for num, kind in _PYTEST_SUMMARY_RE.findall(summary_line):
+        counts[kind] = int(num)
+    return counts["passed"], counts["failed"], counts["error"]
 
 
 def evaluate_functional(workspace: Path, test_dir: str = "tests") -> DimensionScore:
     """Run pytest and score based on pass rate."""
-    result = _run_cmd([sys.executable, "-m", "pytest", test_dir, "-v", "--tb=short"], cwd=workspace)
+    result = _run_cmd(
+        [sys.executable, "-m", "pytest", test_dir, "-v", "--tb=short", *_PYTEST_FAST_FLAGS],
+        cwd=workspace,
+        env=_pytest_env(),
+    )
 
     if result.returncode == -1:
         return DimensionScore("functional", 0.0, WEIGHTS["functional"], "pytest not available", result.stderr)
@@ -147,7 +171,7 @@ def evaluate_type_safety(workspace: Path) -> DimensionScore:
 def evaluate_test_coverage(workspace: Path) -> DimensionScore:
     """Run pytest with coverage and score based on percentage."""
     result = _run_cmd(
-        [sys.executable, "-m", "pytest", "--cov=.", "--cov-report=term-missing", "-q"],
+        [sys.executable, "-m", "pytest", "--cov=.", "--cov-report=term-missing", "-q", *_PYTEST_FAST_FLAGS],
         cwd=workspace,
     )
 
@@ -170,96 +194,154 @@ def evaluate_test_coverage(workspace: Path) -> DimensionScore:
     return DimensionScore("test_coverage", 0.0, WEIGHTS["test_coverage"], "Could not parse coverage", result.stdout[:2000])
 
 
-def evaluate_error_handling(workspace: Path) -> DimensionScore:
-    """Check for error handling patterns in Python code using AST analysis."""
-    py_files = list(workspace.rglob("*.py"))
-    if not py_files:
-        return DimensionScore("error_handling", 0.0, WEIGHTS["error_handling"], "No Python files found")
+# Directories never descended into during workspace scans: virtualenvs,
+# tool caches, VCS internals, and vendored/build output.
+_PRUNE_DIRS = frozenset({
+    ".venv", "venv", "__pycache__", ".git", "node_modules",
+    ".tox", "build", "dist", ".mypy_cache", ".ruff_cache",
+})
+
 
-    bare_except = 0
-    broad_except = 0
-    try_blocks = 0
+def _iter_py_files(root: Path) -> Iterator[Path]:
+    """Yield Python files under root, pruning junk directories wholesale.
 
-    for f in py_files:
-        if ".venv" in str(f) or "__pycache__" in str(f):
+    Path.rglob descends into .venv/node_modules/__pycache__ and filters
+    the results afterwards; pruning at the directory level skips those
+    subtrees entirely, which dominates scan time on any workspace that
+    carries a virtualenv.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
             continue
-        content = f.read_text(errors="replace")
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if entry.name not in _PRUNE_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield Path(entry.path)
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> ast.Module:
+    """Parse one file, memoized on its identity and stat signature.
+
+    Repeated evaluations of an unchanged workspace (standalone evaluator
+    calls, multi-round harness scoring) hit the cache instead of
+    re-reading and re-parsing; rewriting a file changes the stat key and
+    forces a fresh parse.
+    """
+    return ast.parse(Path(path_str).read_bytes(), filename=path_str)
+
+
+@dataclass
+class _AstMetrics:
+    """Counters gathered in a single AST pass over the workspace."""
+
+    py_files: int = 0
+    try_blocks: int = 0
+    bare_except: int = 0
+    broad_except: int = 0
+    total_functions: int = 0
+    long_functions: int = 0
+    total_defs: int = 0
+    with_docstring: int = 0
+
+
+def _collect_ast_metrics(workspace: Path) -> _AstMetrics:
+    """Read, parse, and walk every Python file once for all AST dimensions.
+
+    error_handling, structure, and documentation all inspect the same
+    trees; collecting their counters together means one read + parse +
+    walk per file instead of three.
+    """
+    metrics = _AstMetrics()
+    for f in _iter_py_files(workspace):
+        metrics.py_files += 1
+        # ast.parse accepts bytes and applies PEP 263 decoding itself, so
+        # there's no need to decode to str first; undecodable files raise
+        # SyntaxError and are skipped like any other unparseable file.
         try:
-            tree = ast.parse(content, filename=str(f))
-        except SyntaxError:
+            st = f.stat()
+            tree = _parse_cached(str(f), st.st_mtime_ns, st.st_size)
+        except (SyntaxError, ValueError, OSError):
             continue
         for node in ast.walk(tree):
             if isinstance(node, ast.Try):
-                try_blocks += 1
+                metrics.try_blocks += 1
             elif isinstance(node, ast.ExceptHandler):
                 if node.type is None:
-                    bare_except += 1
+                    metrics.bare_except += 1
                 elif isinstance(node.type, ast.Name) and node.type.id == "Exception":
-                    broad_except += 1
+                    metrics.broad_except += 1
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                metrics.total_functions += 1
+                metrics.total_defs += 1
+                if node.end_lineno is not None and node.end_lineno - node.lineno > 40:
+                    metrics.long_functions += 1
+                if ast.get_docstring(node) is not None:
+                    metrics.with_docstring += 1
+            elif isinstance(node, ast.ClassDef):
+                metrics.total_defs += 1
+                if ast.get_docstring(node) is not None:
+                    metrics.with_docstring += 1
+    return metrics
+
+
+def evaluate_error_handling(workspace: Path, metrics: _AstMetrics | None = None) -> DimensionScore:
+    """Check for error handling patterns in Python code using AST analysis."""
+    if metrics is None:
+        metrics = _collect_ast_metrics(workspace)
+    if metrics.py_files == 0:
+        return DimensionScore("error_handling", 0.0, WEIGHTS["error_handling"], "No Python files found")
 
-    issues = bare_except * 2 + broad_except
+    issues = metrics.bare_except * 2 + metrics.broad_except
     score = max(0.0, 10.0 - issues * 1.5)
 
-    details = f"{try_blocks} try blocks, {bare_except} bare except, {broad_except} broad except"
+    details = (
+        f"{metrics.try_blocks} try blocks, {metrics.bare_except} bare except, "
+        f"{metrics.broad_except} broad except"
+    )
     return DimensionScore("error_handling", score, WEIGHTS["error_handling"], details)
 
 
-def evaluate_structure(workspace: Path) -> DimensionScore:
+def evaluate_structure(workspace: Path, metrics: _AstMetrics | None = None) -> DimensionScore:
     """Evaluate code structure: file count, function size, organization."""
-    py_files = [f for f in workspace.rglob("*.py") if ".venv" not in str(f) and "__pycache__" not in str(f)]
-
-    if not py_files:
+    if metrics is None:
+        metrics = _collect_ast_metrics(workspace)
+    if metrics.py_files == 0:
         return DimensionScore("structure", 0.0, WEIGHTS["structure"], "No Python files")
 
-    long_functions = 0
-    total_functions = 0
-
-    for f in py_files:
-        content = f.read_text(errors="replace")
-        try:
-            tree = ast.parse(content, filename=str(f))
-        except SyntaxError:
-            continue
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                total_functions += 1
-                if node.end_lineno is not None:
-                    func_length = node.end_lineno - node.lineno
-                else:
-                    func_length = 0
-                if func_length > 40:
-                    long_functions += 1
-
-    score = max(0.0, 10.0 - long_functions * 1.0)
-    details = f"{len(py_files)} files, {total_functions} functions, {long_functions} over 40 lines"
+    score = max(0.0, 10.0 - metrics.long_functions * 1.0)
+    details = (
+        f"{metrics.py_files} files, {metrics.total_functions} functions, "
+        f"{metrics.long_functions} over 40 lines"
+    )
     return DimensionScore("structure", score, WEIGHTS["structure"], details)
 
 
-def evaluate_documentation(workspace: Path) -> DimensionScore:
+def evaluate_documentation(workspace: Path, metrics: _AstMetrics | None = None) -> DimensionScore:
     """Check docstring coverage."""
-    py_files = [f for f in workspace.rglob("*.py") if ".venv" not in str(f) and "__pycache__" not in str(f)]
-
-    total_defs = 0
-    with_docstring = 0
-
-    for f in py_files:
-        content = f.read_text(errors="replace")
-        try:
-            tree = ast.parse(content, filename=str(f))
-        except SyntaxError:
-            continue
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                total_defs += 1
-                if ast.get_docstring(node) is not None:
-                    with_docstring += 1
-
-    if total_defs == 0:
+    if metrics is None:
+        metrics = _collect_ast_metrics(workspace)
+    if metrics.total_defs == 0:
         return DimensionScore("documentation", 5.0, WEIGHTS["documentation"], "No definitions found")
 
-    pct = with_docstring / total_defs
+    pct = metrics.with_docstring / metrics.total_defs
     score = pct * 10.0
-    return DimensionScore("documentation", score, WEIGHTS["documentation"], f"{with_docstring}/{total_defs} have docstrings ({pct:.0%})")
+    return DimensionScore(
+        "documentation",
+        score,
+        WEIGHTS["documentation"],
+        f"{metrics.with_docstring}/{metrics.total_defs} have docstrings ({pct:.0%})",
+    )
 
 
 def evaluate_edge_cases(workspace: Path) -> DimensionScore:
@@ -273,8 +355,9 @@ def evaluate_edge_cases(workspace: Path) -> DimensionScore:
         return DimensionScore("edge_cases", 5.0, WEIGHTS["edge_cases"], "No evaluation tests found (neutral score)")
 
     result = _run_cmd(
-        [sys.executable, "-m", "pytest", "evaluation", "-v", "--tb=short"],
+        [sys.executable, "-m", "pytest", "evaluation", "-v", "--tb=short", *_PYTEST_FAST_FLAGS],
         cwd=workspace,
+        env=_pytest_env(),
     )
 
     if result.returncode == -1:
@@ -292,19 +375,38 @@ def evaluate_edge_cases(workspace: Path) -> DimensionScore:
 
 
 def evaluate_all(workspace: Path, functional_test_dir: str = "tests") -> QualityReport:
-    """Run all quality evaluations and produce aggregate report."""
+    """Run all quality evaluations and produce aggregate report.
+
+    The subprocess-bound dimensions (pytest, ruff, mypy, coverage, edge
+    cases) dominate wall time and spend it blocked in subprocess.run, so
+    they fan out on a thread pool; the AST dimensions run on this thread
+    in the meantime. Dimension order in the report is unchanged.
+    """
     report = QualityReport()
 
-    report.dimensions = [
-        evaluate_functional(workspace, functional_test_dir),
-        evaluate_linting(workspace),
-        evaluate_type_safety(workspace),
-        evaluate_test_coverage(workspace),
-        evaluate_error_handling(workspace),
-        evaluate_structure(workspace),
-        evaluate_documentation(workspace),
-        evaluate_edge_cases(workspace),
-    ]
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        functional = pool.submit(evaluate_functional, workspace, functional_test_dir)
+        linting = pool.submit(evaluate_linting, workspace)
+        type_safety = pool.submit(evaluate_type_safety, workspace)
+        coverage = pool.submit(evaluate_test_coverage, workspace)
+        edge_cases = pool.submit(evaluate_edge_cases, workspace)
+
+        # One shared AST pass happens here, overlapping the subprocess futures.
+        metrics = _collect_ast_metrics(workspace)
+        error_handling = evaluate_error_handling(workspace, metrics)
+        structure = evaluate_structure(workspace, metrics)
+        documentation = evaluate_documentation(workspace, metrics)
+
+        report.dimensions = [
+            functional.result(),
+            linting.result(),
+            type_safety.result(),
+            coverage.result(),
+            error_handling,
+            structure,
+            documentation,
+            edge_cases.result(),
+        ]
 
     report.compute_total()
     return report